@@ -1,8 +1,8 @@
-from rundeck_mcp.server import app
-
-
 def main():
     """Main entry point for the rundeck-mcp command."""
+    # Imported here so loading the package entry point stays cheap
+    from rundeck_mcp.server import app
+
     app()
 
 
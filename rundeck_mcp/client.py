@@ -1,23 +1,64 @@
+import asyncio
+import atexit
+import hashlib
+import json
 import logging
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
 from contextvars import ContextVar
-from functools import lru_cache
 from importlib import metadata
 from typing import Any
 
 import httpx
+import ijson
 from dotenv import load_dotenv
 
+try:
+    from orjson import dumps as _json_dumps
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - platforms without orjson wheels
+    from json import loads as _json_loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode obj as compact UTF-8 JSON, matching orjson.dumps output."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+
 from rundeck_mcp import DIST_NAME
 
-logging.basicConfig(level=logging.INFO)
+# Logging handlers are configured by the process owner (see server.py), not on import
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.WARNING)
 
-load_dotenv()
+# Test runners and embedders can skip the .env file lookup
+if os.getenv("RUNDECK_MCP_SKIP_DOTENV") != "1":
+    load_dotenv()
 
 API_TOKEN = os.getenv("RUNDECK_API_TOKEN")
 RUNDECK_URL = os.getenv("RUNDECK_URL", "http://localhost:4440")
 API_VERSION = int(os.getenv("RUNDECK_API_VERSION", "44"))
+_TOKEN_CONFIGURED = bool(API_TOKEN)
+
+REQUEST_TIMEOUT = 30.0
+TRANSPORT_RETRIES = 2
+BATCH_CONCURRENCY = 10
+ETAG_CACHE_SIZE = 128
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=60.0)
+
+_JSON_SCALAR_EVENTS = frozenset({"null", "boolean", "integer", "double", "number", "string"})
+
+
+def _resolve_version() -> str:
+    """Resolve the installed package version for the User-Agent header."""
+    try:
+        return metadata.version(DIST_NAME)
+    except metadata.PackageNotFoundError:
+        return "dev"
+
+
+USER_AGENT = f"{DIST_NAME}/{_resolve_version()}"
 
 
 class RundeckClient:
@@ -37,32 +78,29 @@ class RundeckClient:
         """
         self.base_url = base_url.rstrip("/")
         self.api_version = api_version
+        self._api_prefix = f"{self.base_url}/api/{api_version}"
+        # Server URL and token digest, so per-client caches never share data across credentials
+        self.identity = (self.base_url, hashlib.sha256(api_token.encode()).hexdigest())
+        # Bounded LRU of URL -> (ETag, parsed body) for conditional GETs
+        self._etag_cache: OrderedDict[str, tuple[str, Any]] = OrderedDict()
+        self._etag_lock = threading.Lock()
+        self._headers = {
+            "X-Rundeck-Auth-Token": api_token,
+            "Accept": "application/json",
+            "Content-Type": "application/json",
+            "User-Agent": USER_AGENT,
+        }
+        # HTTP/2 and pool limits must be set on the transport; httpx ignores the
+        # client-level options once a custom transport is supplied.
         self._client = httpx.Client(
-            headers={
-                "X-Rundeck-Auth-Token": api_token,
-                "Accept": "application/json",
-                "Content-Type": "application/json",
-                "User-Agent": self.user_agent,
-            },
-            timeout=30.0,
+            headers=self._headers,
+            timeout=REQUEST_TIMEOUT,
+            transport=httpx.HTTPTransport(http2=True, limits=POOL_LIMITS, retries=TRANSPORT_RETRIES),
         )
 
-    @property
-    def user_agent(self) -> str:
-        """Generate User-Agent string for API requests."""
-        try:
-            version = metadata.version(DIST_NAME)
-        except metadata.PackageNotFoundError:
-            version = "dev"
-        return f"{DIST_NAME}/{version}"
-
     def _url(self, path: str) -> str:
-        """Build full API URL for a given path."""
-        # Handle paths that already include the API version
-        if path.startswith("/api/"):
-            return f"{self.base_url}{path}"
-        # Add API version prefix
-        return f"{self.base_url}/api/{self.api_version}{path}"
+        """Build full API URL for a path relative to the versioned API root."""
+        return self._api_prefix + path
 
     def get(self, path: str, params: dict[str, Any] | None = None) -> Any:
         """Make a GET request to the Rundeck API.
@@ -71,15 +109,79 @@ class RundeckClient:
             path: API endpoint path (e.g., '/project/myproject/jobs')
             params: Optional query parameters
 
+        Responses that carry an ETag are cached per URL. Repeated requests send
+        If-None-Match, and a 304 Not Modified reply returns the cached value
+        without transferring or parsing the body again.
+
         Returns:
             Parsed JSON response
 
         Raises:
             httpx.HTTPStatusError: If the request fails
         """
-        response = self._client.get(self._url(path), params=params)
+        request = self._client.build_request("GET", self._url(path), params=params)
+        key = str(request.url)
+
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+            if cached is not None:
+                self._etag_cache.move_to_end(key)
+        if cached is not None:
+            request.headers["If-None-Match"] = cached[0]
+
+        response = self._client.send(request)
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            return cached[1]
         response.raise_for_status()
-        return response.json()
+        data = _json_loads(response.content)
+
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, data)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return data
+
+    def stream_json(self, path: str, params: dict[str, Any] | None = None, *, items: str) -> Iterator[tuple[str, Any]]:
+        """Make a GET request and parse the JSON object response incrementally.
+
+        The response body is parsed while it is being read, so large responses
+        are never buffered in full. Yields a (name, value) pair for each scalar
+        top-level member, and an (items, element) pair for each element of the
+        top-level array named by `items`. Any other nested members are skipped.
+
+        Args:
+            path: API endpoint path (e.g., '/execution/123/output')
+            params: Optional query parameters
+            items: Name of the top-level array member to stream element by element
+
+        Yields:
+            (member name, value) pairs in document order
+
+        Raises:
+            httpx.HTTPStatusError: If the request fails
+        """
+        item_prefix = f"{items}.item"
+        builder: ijson.ObjectBuilder | None = None
+
+        with self._client.stream("GET", self._url(path), params=params) as response:
+            response.raise_for_status()
+            for prefix, event, value in _iter_json_events(response.iter_bytes()):
+                if builder is not None:
+                    builder.event(event, value)
+                    if prefix == item_prefix and event in ("end_map", "end_array"):
+                        yield items, builder.value
+                        builder = None
+                elif prefix == item_prefix:
+                    if event in ("start_map", "start_array"):
+                        builder = ijson.ObjectBuilder()
+                        builder.event(event, value)
+                    else:
+                        yield items, value
+                elif event in _JSON_SCALAR_EVENTS and prefix and "." not in prefix:
+                    yield prefix, value
 
     def post(self, path: str, json: dict[str, Any] | None = None) -> Any:
         """Make a POST request to the Rundeck API.
@@ -94,24 +196,117 @@ class RundeckClient:
         Raises:
             httpx.HTTPStatusError: If the request fails
         """
-        response = self._client.post(self._url(path), json=json or {})
+        response = self._client.post(self._url(path), content=_json_dumps(json or {}))
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
+
+    async def get_many(self, paths_and_params: list[tuple[str, dict[str, Any] | None]]) -> list[Any]:
+        """Make several GET requests to the Rundeck API concurrently.
+
+        Works like post_many: requests are multiplexed over one HTTP/2
+        connection, and a failed request's exception is returned in place of
+        its response.
+
+        Args:
+            paths_and_params: List of (path, query parameters) pairs
+
+        Returns:
+            Parsed JSON responses (or raised exceptions), in request order
+        """
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async with self.async_client() as client:
+
+            async def _get(path: str, params: dict[str, Any] | None) -> Any:
+                async with semaphore:
+                    response = await client.get(self._url(path), params=params)
+                response.raise_for_status()
+                return _json_loads(response.content)
+
+            return await asyncio.gather(
+                *(_get(path, params) for path, params in paths_and_params),
+                return_exceptions=True,
+            )
+
+    async def post_many(self, paths_and_bodies: list[tuple[str, dict[str, Any] | None]]) -> list[Any]:
+        """Make several POST requests to the Rundeck API concurrently.
+
+        Requests share one async client, so they are multiplexed over a single
+        HTTP/2 connection, with at most BATCH_CONCURRENCY in flight at a time.
+        A failed request does not abort the batch: its exception is returned in
+        place of the response so callers can report partial results.
+
+        Args:
+            paths_and_bodies: List of (path, request body) pairs
+
+        Returns:
+            Parsed JSON responses (or raised exceptions), in request order
+        """
+        semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+
+        async with self.async_client() as client:
+
+            async def _post(path: str, json: dict[str, Any] | None) -> Any:
+                async with semaphore:
+                    response = await client.post(self._url(path), content=_json_dumps(json or {}))
+                response.raise_for_status()
+                return _json_loads(response.content)
+
+            return await asyncio.gather(
+                *(_post(path, json) for path, json in paths_and_bodies),
+                return_exceptions=True,
+            )
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Create an async HTTP client with the same headers and pool limits.
+
+        Async clients are bound to the event loop they are used in, so a new one
+        is created per call. Use it as an async context manager so concurrent
+        requests share its HTTP/2 connection and it is closed afterwards.
+
+        Returns:
+            Configured httpx.AsyncClient instance
+        """
+        return httpx.AsyncClient(
+            headers=self._headers,
+            timeout=REQUEST_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(http2=True, limits=POOL_LIMITS, retries=TRANSPORT_RETRIES),
+        )
 
     def close(self) -> None:
         """Close the HTTP client."""
         self._client.close()
 
 
+def _iter_json_events(chunks: Iterable[bytes]) -> Iterator[tuple[str, str, Any]]:
+    """Parse JSON from byte chunks into ijson (prefix, event, value) events."""
+    events = ijson.sendable_list()
+    parser = ijson.parse_coro(events, use_float=True)
+    for chunk in chunks:
+        parser.send(chunk)
+        yield from events
+        del events[:]
+    parser.close()
+    yield from events
+
+
 # Context variable for multi-tenancy support (remote MCP server scenarios)
 ClientFactory = type[RundeckClient] | None
 rundeck_client_factory: ContextVar[ClientFactory] = ContextVar("rundeck_client_factory", default=None)
+_get_client_factory = rundeck_client_factory.get
+
+# Process-wide client for the single-tenant (environment variable) configuration
+_CLIENT: RundeckClient | None = None
+_CLIENT_LOCK = threading.Lock()
 
 
-@lru_cache(maxsize=1)
-def _get_cached_client(api_token: str, base_url: str, api_version: int) -> RundeckClient:
-    """Get a cached Rundeck client instance."""
-    return RundeckClient(api_token, base_url, api_version)
+def _close_client() -> None:
+    """Close the process-wide client, if one was created."""
+    if _CLIENT is not None:
+        _CLIENT.close()
+
+
+atexit.register(_close_client)
 
 
 def get_client() -> RundeckClient:
@@ -128,14 +323,23 @@ def get_client() -> RundeckClient:
     Raises:
         ValueError: If RUNDECK_API_TOKEN is not configured
     """
-    factory = rundeck_client_factory.get(None)
+    global _CLIENT
+    factory = _get_client_factory()
     if factory is not None:
         return factory(API_TOKEN, RUNDECK_URL, API_VERSION)
 
-    if not API_TOKEN:
+    # Single-tenant fast path: the client already exists
+    client = _CLIENT
+    if client is not None:
+        return client
+
+    if not _TOKEN_CONFIGURED:
         raise ValueError(
             "RUNDECK_API_TOKEN environment variable is required. "
             "Generate a token in Rundeck under User Profile > User API Tokens."
         )
 
-    return _get_cached_client(API_TOKEN, RUNDECK_URL, API_VERSION)
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = RundeckClient(API_TOKEN, RUNDECK_URL, API_VERSION)
+    return _CLIENT
@@ -1,12 +1,15 @@
 from .base import DEFAULT_PAGINATION_LIMIT, MAX_RESULTS, MAXIMUM_PAGINATION_LIMIT, ListResponseModel
 from .context import MCPContext
 from .executions import (
+    EXECUTION_LIST_ADAPTER,
+    LOG_ENTRIES_ADAPTER,
     Execution,
     ExecutionOutput,
     ExecutionQuery,
     LogEntry,
 )
 from .jobs import (
+    BatchJobRunRequest,
     Job,
     JobOption,
     JobQuery,
@@ -17,8 +20,11 @@ from .jobs import (
 
 __all__ = [
     "DEFAULT_PAGINATION_LIMIT",
+    "EXECUTION_LIST_ADAPTER",
+    "LOG_ENTRIES_ADAPTER",
     "MAXIMUM_PAGINATION_LIMIT",
     "MAX_RESULTS",
+    "BatchJobRunRequest",
     "Execution",
     "ExecutionOutput",
     "ExecutionQuery",
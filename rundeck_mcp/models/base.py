@@ -1,4 +1,4 @@
-from typing import TypeVar
+from typing import Any, ClassVar, TypeVar
 
 from pydantic import BaseModel, computed_field
 
@@ -6,6 +6,11 @@ DEFAULT_PAGINATION_LIMIT = 20
 MAXIMUM_PAGINATION_LIMIT = 100
 MAX_RESULTS = 1000
 
+RESULT_LIMIT_WARNING = (
+    "- WARNING: The number of records equals the response limit. There may be more"
+    " records not included in this response."
+)
+
 T = TypeVar("T", bound=BaseModel)
 
 
@@ -17,21 +22,23 @@ class ListResponseModel[T: BaseModel](BaseModel):
     with any entity type (e.g., Job, Execution, etc.).
     """
 
+    # Entity type name, resolved once per parametrized class (e.g., ListResponseModel[Job])
+    _entity_name: ClassVar[str] = "Unknown"
+
     response: list[T]
 
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        args = cls.__pydantic_generic_metadata__["args"]
+        if args:
+            cls._entity_name = getattr(args[0], "__name__", "Unknown")
+
     @computed_field
     @property
     def response_summary(self) -> str:
         """Generate a summary of the response."""
         count = len(self.response)
-        entity_type = self.response[0].__class__.__name__ if self.response else "Unknown"
-        summary = [
-            f"ListResponseModel<{entity_type}>:",
-            f"- Returned {count} record(s) of type '{entity_type}'.",
-        ]
-        if count == MAX_RESULTS:
-            summary.append(
-                "- WARNING: The number of records equals the response limit. There may be more"
-                " records not included in this response."
-            )
-        return "\n".join(summary)
+        entity_type = self._entity_name
+        warning = f"\n{RESULT_LIMIT_WARNING}" if count == MAX_RESULTS else ""
+        return f"ListResponseModel<{entity_type}>:\n- Returned {count} record(s) of type '{entity_type}'.{warning}"
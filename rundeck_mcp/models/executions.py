@@ -1,16 +1,37 @@
-from datetime import datetime
+import sys
+from datetime import UTC, datetime
+from functools import cached_property
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
-
-from rundeck_mcp.models.base import MAX_RESULTS
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    FieldSerializationInfo,
+    TypeAdapter,
+    computed_field,
+    field_serializer,
+    field_validator,
+)
+from pydantic.dataclasses import dataclass
+
+from rundeck_mcp.models.base import MAX_RESULTS, ListResponseModel
 from rundeck_mcp.models.jobs import JobReference
 
 ExecutionStatus = Literal["running", "succeeded", "failed", "aborted", "timedout", "scheduled"]
 
 
-class LogEntry(BaseModel):
-    """A single log entry from an execution."""
+# Interned Rundeck log level names, so entries do not each carry their own copy
+_LOG_LEVELS = {level: sys.intern(level) for level in ("NORMAL", "ERROR", "WARN", "INFO", "DEBUG", "VERBOSE")}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True, config=ConfigDict(populate_by_name=True, extra="ignore"))
+class LogEntry:
+    """A single log entry from an execution.
+
+    Defined as a slotted dataclass rather than a model since outputs can carry
+    thousands of entries; parse them in bulk with LOG_ENTRIES_ADAPTER.
+    """
 
     time: str | None = Field(default=None, description="Timestamp of the log entry")
     absolute_time: str | None = Field(
@@ -19,11 +40,21 @@ class LogEntry(BaseModel):
         description="Absolute timestamp",
     )
     level: str = Field(default="NORMAL", description="Log level (e.g., NORMAL, ERROR, WARN, DEBUG)")
-    log: str = Field(description="The log message content")
+    log: str = Field(default="", description="The log message content")
     node: str | None = Field(default=None, description="Node that produced this log entry")
     step: str | None = Field(default=None, alias="stepctx", description="Step context identifier")
     user: str | None = Field(default=None, description="User associated with this log entry")
 
+    @field_validator("level")
+    @classmethod
+    def intern_level(cls, v: str) -> str:
+        """Share one string object per known log level across all entries."""
+        return _LOG_LEVELS.get(v, v)
+
+
+# Cached validator for raw API log entries, parsed as a whole list in one call
+LOG_ENTRIES_ADAPTER = TypeAdapter(list[LogEntry])
+
 
 class ExecutionOutput(BaseModel):
     """Output/logs from a job execution.
@@ -32,6 +63,8 @@ class ExecutionOutput(BaseModel):
     Use the 'completed' field to determine if the execution has finished.
     """
 
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
     id: int = Field(description="The execution ID")
     offset: int = Field(default=0, description="Byte offset in the log file")
     completed: bool = Field(description="Whether the execution has completed")
@@ -95,6 +128,8 @@ class Execution(BaseModel):
     Represents a single run of a job, including its status, timing, and results.
     """
 
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
     id: int = Field(description="The execution ID")
     href: str | None = Field(default=None, description="API URL for this execution")
     permalink: str | None = Field(default=None, description="Web UI URL for this execution")
@@ -132,18 +167,18 @@ class Execution(BaseModel):
     @classmethod
     def parse_date_dict(cls, v: Any) -> datetime | None:
         """Parse date from Rundeck's dict format or ISO string."""
-        if v is None:
-            return None
-        if isinstance(v, datetime):
+        if v is None or isinstance(v, datetime):
             return v
         if isinstance(v, dict):
-            # Rundeck returns {"unixtime": 1234567890, "date": "..."}
-            if "unixtime" in v:
-                return datetime.fromtimestamp(v["unixtime"] / 1000)
-            if "date" in v:
-                return datetime.fromisoformat(v["date"].replace("Z", "+00:00"))
+            # Rundeck returns {"unixtime": 1234567890000, "date": "..."}
+            unixtime = v.get("unixtime")
+            if unixtime is not None:
+                return datetime.fromtimestamp(unixtime / 1000, tz=UTC)
+            date = v.get("date")
+            return datetime.fromisoformat(date) if date else None
         if isinstance(v, str):
-            return datetime.fromisoformat(v.replace("Z", "+00:00"))
+            # fromisoformat accepts the trailing "Z" natively since Python 3.11
+            return datetime.fromisoformat(v)
         return None
 
     @computed_field
@@ -154,7 +189,6 @@ class Execution(BaseModel):
             return (self.date_ended - self.date_started).total_seconds()
         return None
 
-    @computed_field
     @property
     def execution_summary(self) -> str:
         """Generate a human-readable summary of this execution."""
@@ -182,33 +216,47 @@ class Execution(BaseModel):
         return "execution"
 
 
+# Cached validator for list_executions responses, built once instead of per call
+EXECUTION_LIST_ADAPTER = TypeAdapter(ListResponseModel[Execution])
+
+
 class ExecutionQuery(BaseModel):
-    """Query parameters for listing executions."""
+    """Query parameters for listing executions.
+
+    Queries are frozen, so they are hashable and can key request caches; the
+    begin/end timestamp conversions are computed once per instance.
+    """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     project: str | None = Field(
         default=None,
+        exclude=True,
         description="Filter by project name",
     )
     job_id: str | None = Field(
         default=None,
+        exclude=True,
         description="Filter by job ID (UUID)",
     )
     status: ExecutionStatus | None = Field(
         default=None,
+        serialization_alias="statusFilter",
         description="Filter by execution status",
     )
     user: str | None = Field(
         default=None,
+        serialization_alias="userFilter",
         description="Filter by user who started the execution",
     )
     recent_filter: str | None = Field(
         default=None,
+        serialization_alias="recentFilter",
         description="Filter by recent time period (e.g., '1h', '1d', '1w')",
     )
     older_filter: str | None = Field(
         default=None,
+        serialization_alias="olderFilter",
         description="Filter for executions older than this period",
     )
     begin: datetime | None = Field(
@@ -221,6 +269,7 @@ class ExecutionQuery(BaseModel):
     )
     limit: int = Field(
         default=20,
+        serialization_alias="max",
         ge=1,
         le=MAX_RESULTS,
         description="Maximum number of results to return",
@@ -231,21 +280,27 @@ class ExecutionQuery(BaseModel):
         description="Offset for pagination",
     )
 
+    @cached_property
+    def begin_ms(self) -> int | None:
+        """The begin filter as a millisecond unix timestamp."""
+        return int(self.begin.timestamp() * 1000) if self.begin else None
+
+    @cached_property
+    def end_ms(self) -> int | None:
+        """The end filter as a millisecond unix timestamp."""
+        return int(self.end.timestamp() * 1000) if self.end else None
+
+    @field_validator("user", "recent_filter", "older_filter")
+    @classmethod
+    def _empty_filter_as_none(cls, v: str | None) -> str | None:
+        """Treat empty filters as unset so they are not sent."""
+        return v or None
+
+    @field_serializer("begin", "end", when_used="unless-none")
+    def _serialize_unixtime_ms(self, _value: datetime, info: FieldSerializationInfo) -> int | None:
+        """Serialize datetimes as Rundeck's millisecond unix timestamps."""
+        return getattr(self, f"{info.field_name}_ms")
+
     def to_params(self) -> dict[str, Any]:
         """Convert query to API parameters."""
-        params: dict[str, Any] = {"max": self.limit, "offset": self.offset}
-
-        if self.status:
-            params["statusFilter"] = self.status
-        if self.user:
-            params["userFilter"] = self.user
-        if self.recent_filter:
-            params["recentFilter"] = self.recent_filter
-        if self.older_filter:
-            params["olderFilter"] = self.older_filter
-        if self.begin:
-            params["begin"] = int(self.begin.timestamp() * 1000)
-        if self.end:
-            params["end"] = int(self.end.timestamp() * 1000)
-
-        return params
+        return self.model_dump(exclude_none=True, by_alias=True)
@@ -1,6 +1,7 @@
+from functools import cached_property
 from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
 
 from rundeck_mcp.models.base import MAX_RESULTS
 
@@ -13,6 +14,8 @@ class JobOption(BaseModel):
     of allowed values.
     """
 
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
     name: str = Field(description="The option name/identifier")
     description: str | None = Field(default=None, description="Description of what this option does")
     required: bool = Field(default=False, description="Whether this option must be provided")
@@ -28,7 +31,11 @@ class JobOption(BaseModel):
     multivalued: bool = Field(default=False, description="Whether multiple values can be selected")
     delimiter: str | None = Field(default=None, description="Delimiter for multivalued options")
     secure: bool = Field(default=False, description="Whether this is a secure/password option")
-    storage_path: str | None = Field(default=None, description="Key storage path for secure options")
+    storage_path: str | None = Field(
+        default=None,
+        alias="storagePath",
+        description="Key storage path for secure options",
+    )
     option_type: str | None = Field(default=None, alias="type", description="Option type (e.g., 'file')")
 
     @computed_field
@@ -58,6 +65,8 @@ class JobOption(BaseModel):
 class JobReference(BaseModel):
     """A minimal reference to a job, used in execution responses."""
 
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
     id: str = Field(description="The job UUID")
     name: str = Field(description="The job name")
     group: str | None = Field(default=None, description="The job group path")
@@ -73,6 +82,8 @@ class Job(BaseModel):
     to execute, along with options that parameterize the execution.
     """
 
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
     id: str = Field(description="The job UUID")
     name: str = Field(description="The job name")
     group: str | None = Field(default=None, description="The job group path (e.g., 'deploy/production')")
@@ -81,7 +92,11 @@ class Job(BaseModel):
     href: str | None = Field(default=None, description="API URL for this job")
     permalink: str | None = Field(default=None, description="Web UI URL for this job")
     scheduled: bool = Field(default=False, description="Whether this job has a schedule")
-    schedule_enabled: bool = Field(default=True, description="Whether the schedule is enabled")
+    schedule_enabled: bool = Field(
+        default=True,
+        alias="scheduleEnabled",
+        description="Whether the schedule is enabled",
+    )
     enabled: bool = Field(default=True, description="Whether the job is enabled for execution")
     average_duration: int | None = Field(
         default=None,
@@ -93,25 +108,29 @@ class Job(BaseModel):
         description="List of options/parameters for this job",
     )
 
-    @computed_field
-    @property
-    def options_summary(self) -> str | None:
-        """Generate a summary of job options for display."""
+    @cached_property
+    def _option_views(self) -> tuple[tuple[str, ...], str | None]:
+        """Build the required option names and the options summary in one pass."""
         if not self.options:
-            return None
+            return (), None
 
-        lines = ["Job Options:"]
+        required = []
+        summaries = []
         for opt in self.options:
-            lines.append(f"  - {opt.option_summary}")
-        return "\n".join(lines)
+            if opt.required:
+                required.append(opt.name)
+            summaries.append(opt.option_summary)
+        return tuple(required), "Job Options:\n  - " + "\n  - ".join(summaries)
+
+    @property
+    def options_summary(self) -> str | None:
+        """Generate a summary of job options for display."""
+        return self._option_views[1]
 
-    @computed_field
     @property
     def required_options(self) -> list[str]:
         """List of required option names that must be provided."""
-        if not self.options:
-            return []
-        return [opt.name for opt in self.options if opt.required]
+        return list(self._option_views[0])
 
     @computed_field
     @property
@@ -124,25 +143,30 @@ class JobQuery(BaseModel):
 
     model_config = ConfigDict(extra="forbid")
 
-    project: str = Field(description="Project name (required)")
+    project: str = Field(exclude=True, description="Project name (required)")
     group_path: str | None = Field(
         default=None,
+        serialization_alias="groupPath",
         description="Filter by group path. Use '*' for all groups, '' for root level only.",
     )
     job_filter: str | None = Field(
         default=None,
+        serialization_alias="jobFilter",
         description="Filter by job name (substring match)",
     )
     job_exact_filter: str | None = Field(
         default=None,
+        serialization_alias="jobExactFilter",
         description="Filter by exact job name",
     )
     group_path_exact: str | None = Field(
         default=None,
+        serialization_alias="groupPathExact",
         description="Filter by exact group path",
     )
     scheduled_filter: bool | None = Field(
         default=None,
+        serialization_alias="scheduledFilter",
         description="Filter to only scheduled jobs (true) or only non-scheduled (false)",
     )
     tags: str | None = Field(
@@ -150,30 +174,27 @@ class JobQuery(BaseModel):
         description="Filter by tags (comma-separated)",
     )
     limit: int = Field(
-        default=MAX_RESULTS,
+        default=50,
+        serialization_alias="max",
         ge=1,
         le=MAX_RESULTS,
-        description="Maximum number of results to return",
+        description="Maximum number of results to return (page size)",
     )
+    offset: int = Field(
+        default=0,
+        ge=0,
+        description="Offset for pagination",
+    )
+
+    @field_validator("job_filter", "job_exact_filter", "group_path_exact", "tags")
+    @classmethod
+    def _empty_filter_as_none(cls, v: str | None) -> str | None:
+        """Treat empty filters as unset so they are not sent; '' is meaningful only for group_path."""
+        return v or None
 
     def to_params(self) -> dict[str, Any]:
         """Convert query to API parameters."""
-        params: dict[str, Any] = {}
-        if self.group_path is not None:
-            params["groupPath"] = self.group_path
-        if self.job_filter:
-            params["jobFilter"] = self.job_filter
-        if self.job_exact_filter:
-            params["jobExactFilter"] = self.job_exact_filter
-        if self.group_path_exact:
-            params["groupPathExact"] = self.group_path_exact
-        if self.scheduled_filter is not None:
-            params["scheduledFilter"] = self.scheduled_filter
-        if self.tags:
-            params["tags"] = self.tags
-        if self.limit:
-            params["max"] = self.limit
-        return params
+        return self.model_dump(exclude_none=True, by_alias=True)
 
 
 class JobRunRequest(BaseModel):
@@ -192,34 +213,45 @@ class JobRunRequest(BaseModel):
     )
     log_level: Literal["DEBUG", "VERBOSE", "INFO", "WARN", "ERROR"] | None = Field(
         default=None,
+        serialization_alias="loglevel",
         description="Log level for the execution",
     )
     as_user: str | None = Field(
         default=None,
+        serialization_alias="asUser",
         description="Run the job as this user (requires 'runAs' permission)",
     )
     node_filter: str | None = Field(
         default=None,
+        serialization_alias="filter",
         description="Override the node filter for this execution",
     )
 
+    @field_validator("options", "as_user", "node_filter")
+    @classmethod
+    def _empty_as_none(cls, v: Any) -> Any:
+        """Treat empty options and strings as unset so they are left out of the request body."""
+        return v or None
+
     def to_request_body(self) -> dict[str, Any]:
         """Convert to API request body."""
-        body: dict[str, Any] = {}
-        if self.options:
-            body["options"] = self.options
-        if self.log_level:
-            body["loglevel"] = self.log_level
-        if self.as_user:
-            body["asUser"] = self.as_user
-        if self.node_filter:
-            body["filter"] = self.node_filter
-        return body
+        return self.model_dump(exclude_none=True, by_alias=True)
+
+
+class BatchJobRunRequest(JobRunRequest):
+    """Request model for one job in a batch run.
+
+    Same as JobRunRequest, with the ID of the job to execute.
+    """
+
+    job_id: str = Field(exclude=True, description="The job UUID to execute")
 
 
 class JobRunResponse(BaseModel):
     """Response from running a job."""
 
+    model_config = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
     id: int = Field(description="The execution ID")
     href: str = Field(description="API URL for this execution")
     permalink: str = Field(description="Web UI URL for this execution")
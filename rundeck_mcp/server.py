@@ -1,14 +1,15 @@
 import logging
 from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
 
 import typer
 from mcp.server.fastmcp import FastMCP
 from mcp.types import ToolAnnotations
 
-from rundeck_mcp.models import MCPContext
-from rundeck_mcp.tools import read_tools, write_tools
-from rundeck_mcp.utils import get_mcp_context
+# The models and client are imported when the server starts, so --help does not load them
+if TYPE_CHECKING:
+    from rundeck_mcp.models import MCPContext
 
 logging.basicConfig(level=logging.WARNING)
 
@@ -26,7 +27,7 @@ see the exact table with job numbers (# column) so they can reference jobs by nu
 
 When running a job with options:
 1. First use get_job to retrieve the job definition and see available options
-2. Review the options_summary field to understand required options and allowed values
+2. Review the options table to understand required options and allowed values
 3. Provide all required options that don't have defaults
 4. For options with allowed values (enforced=true), use only values from the list
 
@@ -37,7 +38,7 @@ especially in production environments.
 
 
 @asynccontextmanager
-async def app_lifespan(server: FastMCP) -> AsyncIterator[MCPContext]:
+async def app_lifespan(server: FastMCP) -> AsyncIterator["MCPContext"]:
     """Lifespan context manager for the MCP server.
 
     Initializes the Rundeck client and creates the context that will be
@@ -49,6 +50,8 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[MCPContext]:
     Yields:
         MCPContext with server configuration
     """
+    from rundeck_mcp.utils import get_mcp_context
+
     try:
         yield get_mcp_context()
     finally:
@@ -98,6 +101,9 @@ def run(*, enable_write_tools: bool = False) -> None:
     Args:
         enable_write_tools: Flag to enable write tools (job execution)
     """
+    # Deferred so the tool modules, models and client only load when serving
+    from rundeck_mcp.tools import read_tools, write_tools
+
     mcp = FastMCP(
         "Rundeck MCP Server",
         lifespan=app_lifespan,
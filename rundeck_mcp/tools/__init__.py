@@ -2,11 +2,15 @@ from .executions import (
     get_execution,
     get_execution_output,
     list_executions,
+    list_executions_many,
 )
 from .jobs import (
     get_job,
+    get_jobs_bulk,
     list_jobs,
     run_job,
+    run_job_by_index,
+    run_jobs,
 )
 
 # Read-only tools (safe, non-destructive operations)
@@ -14,8 +18,10 @@ read_tools = [
     # Jobs
     list_jobs,
     get_job,
+    get_jobs_bulk,
     # Executions
     list_executions,
+    list_executions_many,
     get_execution,
     get_execution_output,
 ]
@@ -24,6 +30,8 @@ read_tools = [
 write_tools = [
     # Jobs
     run_job,
+    run_job_by_index,
+    run_jobs,
 ]
 
 # All tools (combined list for backward compatibility)
@@ -1,7 +1,14 @@
+from collections.abc import Iterator
+from contextlib import closing
+from functools import lru_cache
 from typing import Any
 
+from pydantic import TypeAdapter
+
 from rundeck_mcp.client import get_client
 from rundeck_mcp.models import (
+    EXECUTION_LIST_ADAPTER,
+    LOG_ENTRIES_ADAPTER,
     Execution,
     ExecutionOutput,
     ExecutionQuery,
@@ -10,6 +17,9 @@ from rundeck_mcp.models import (
 )
 from rundeck_mcp.models.jobs import JobReference
 
+_EXECUTION_QUERIES_ADAPTER = TypeAdapter(list[ExecutionQuery])
+_LOG_ENTRY_ADAPTER = TypeAdapter(LogEntry)
+
 
 def list_executions(query: ExecutionQuery) -> ListResponseModel[Execution]:
     """List job executions with optional filtering.
@@ -41,21 +51,39 @@ def list_executions(query: ExecutionQuery) -> ListResponseModel[Execution]:
         ... ))
     """
     client = get_client()
-    params = query.to_params()
+    response = client.get(_executions_path(query), params=query.to_params())
+    return _parse_executions_response(response)
 
-    # Use job-specific endpoint if job_id is provided
-    if query.job_id:
-        response = client.get(f"/job/{query.job_id}/executions", params=params)
-    elif query.project:
-        response = client.get(f"/project/{query.project}/executions", params=params)
-    else:
-        raise ValueError("Either project or job_id must be provided")
 
-    # Handle response format (executions are nested in 'executions' key)
-    executions_data = response.get("executions", []) if isinstance(response, dict) else response
+async def list_executions_many(queries: list[ExecutionQuery]) -> list[ListResponseModel[Execution]]:
+    """List job executions for several queries in one batch.
 
-    executions = [_parse_execution(exec_data) for exec_data in executions_data]
-    return ListResponseModel[Execution](response=executions)
+    Works like list_executions for each query, with all requests sent
+    concurrently. Use it to fetch executions for many jobs or projects at once.
+
+    Args:
+        queries: Query parameters for each execution listing
+
+    Returns:
+        One list of Execution objects per query, in query order
+
+    Examples:
+        List recent executions for two jobs:
+        >>> results = await list_executions_many([
+        ...     ExecutionQuery(job_id="abc-123-def"),
+        ...     ExecutionQuery(job_id="def-456-abc", status="failed"),
+        ... ])
+    """
+    queries = _EXECUTION_QUERIES_ADAPTER.validate_python(queries)
+    paths_and_params = [(_executions_path(query), query.to_params()) for query in queries]
+
+    client = get_client()
+    responses = await client.get_many(paths_and_params)
+
+    for response in responses:
+        if isinstance(response, BaseException):
+            raise response
+    return [_parse_executions_response(response) for response in responses]
 
 
 def get_execution(execution_id: int) -> Execution:
@@ -122,7 +150,83 @@ def get_execution_output(
         ...     # process new entries
     """
     client = get_client()
+    path, params = _output_request(execution_id, last_lines, max_lines, offset, node)
+
+    # Stream the response so large logs are parsed while they are read. Entries
+    # beyond the requested line count are dropped as they arrive; the rest of the
+    # body is still read since output metadata may follow the entries.
+    limit = max_lines if max_lines is not None else last_lines
+    data: dict[str, Any] = {}
+    entries: list[dict[str, Any]] = []
+    for name, value in client.stream_json(path, params=params, items="entries"):
+        if name != "entries":
+            data[name] = value
+        elif limit is None or len(entries) < limit:
+            entries.append(value)
+    data["entries"] = entries
+
+    return _parse_execution_output(execution_id, data)
+
 
+def iter_execution_output(
+    execution_id: int,
+    last_lines: int | None = None,
+    max_lines: int | None = None,
+    offset: int | None = None,
+    node: str | None = None,
+) -> Iterator[LogEntry]:
+    """Iterate over the log entries of a job execution as they are downloaded.
+
+    Takes the same arguments as get_execution_output, but yields each entry as
+    soon as it is parsed from the response, so only one entry is held in memory
+    at a time. Output metadata (offset, completion) is not returned; use
+    get_execution_output when it is needed.
+
+    Args:
+        execution_id: The execution ID (integer)
+        last_lines: Return only the last N lines (overrides offset)
+        max_lines: Maximum number of lines to return from offset
+        offset: Byte offset to start reading from (for tailing)
+        node: Filter output to a specific node
+
+    Yields:
+        LogEntry objects in log order
+
+    Examples:
+        >>> for entry in iter_execution_output(12345, max_lines=10000):
+        ...     if entry.level == "ERROR":
+        ...         print(entry.log)
+    """
+    client = get_client()
+    path, params = _output_request(execution_id, last_lines, max_lines, offset, node)
+
+    # Stop reading once the requested line count is reached; no metadata is needed
+    limit = max_lines if max_lines is not None else last_lines
+    if limit == 0:
+        return
+    count = 0
+    # Closing the stream on early exit releases the HTTP response and its pooled connection right away
+    with closing(client.stream_json(path, params=params, items="entries")) as members:
+        for name, value in members:
+            if name == "entries":
+                yield _LOG_ENTRY_ADAPTER.validate_python(value)
+                count += 1
+                if count == limit:
+                    return
+
+
+def _output_request(
+    execution_id: int,
+    last_lines: int | None,
+    max_lines: int | None,
+    offset: int | None,
+    node: str | None,
+) -> tuple[str, dict[str, Any]]:
+    """Build the API path and parameters for an execution output request.
+
+    Returns:
+        Tuple of (path, query parameters)
+    """
     # Build path with optional node filter
     path = f"/execution/{execution_id}/output"
     if node:
@@ -137,14 +241,53 @@ def get_execution_output(
     if offset is not None:
         params["offset"] = offset
 
-    response = client.get(path, params=params)
+    return path, params
+
+
+def _executions_path(query: ExecutionQuery) -> str:
+    """Get the API path that lists executions for a query.
 
-    return _parse_execution_output(execution_id, response)
+    Args:
+        query: Query parameters for filtering executions
+
+    Returns:
+        Job executions path if job_id is set, otherwise the project executions path
+
+    Raises:
+        ValueError: If neither project nor job_id is set
+    """
+    # Use job-specific endpoint if job_id is provided
+    if query.job_id:
+        return f"/job/{query.job_id}/executions"
+    if query.project:
+        return f"/project/{query.project}/executions"
+    raise ValueError("Either project or job_id must be provided")
+
+
+def _parse_executions_response(response: Any) -> ListResponseModel[Execution]:
+    """Parse an execution listing from API response.
+
+    Args:
+        response: Raw API response data
+
+    Returns:
+        List of parsed Execution models
+    """
+    # Handle response format (executions are nested in 'executions' key)
+    executions_data = response.get("executions", []) if isinstance(response, dict) else response
+
+    # map() resolves the parser once instead of per row
+    executions = list(map(_parse_execution, executions_data))
+    return EXECUTION_LIST_ADAPTER.validate_python({"response": executions})
 
 
 def _parse_execution(data: dict[str, Any]) -> Execution:
     """Parse execution data from API response.
 
+    The Execution is validated, so an unexpected status or field type fails
+    here rather than in the formatters. Only the job reference is built with
+    model_construct, to share one instance across a page.
+
     Args:
         data: Raw API response data
 
@@ -155,13 +298,13 @@ def _parse_execution(data: dict[str, Any]) -> Execution:
     job_data = data.get("job")
     job_ref = None
     if job_data:
-        job_ref = JobReference(
-            id=job_data.get("id", ""),
-            name=job_data.get("name", ""),
-            group=job_data.get("group"),
-            project=job_data.get("project", data.get("project", "")),
-            href=job_data.get("href"),
-            permalink=job_data.get("permalink"),
+        job_ref = _job_reference(
+            job_data.get("id", ""),
+            job_data.get("name", ""),
+            job_data.get("group"),
+            job_data.get("project", data.get("project", "")),
+            job_data.get("href"),
+            job_data.get("permalink"),
         )
 
     return Execution(
@@ -181,6 +324,30 @@ def _parse_execution(data: dict[str, Any]) -> Execution:
     )
 
 
+@lru_cache(maxsize=1024)
+def _job_reference(
+    job_id: str,
+    name: str,
+    group: str | None,
+    project: str,
+    href: str | None,
+    permalink: str | None,
+) -> JobReference:
+    """Build a job reference, shared between executions of the same job.
+
+    JobReference is frozen, so one instance can safely be reused by every
+    execution on a page that references the same job.
+    """
+    return JobReference.model_construct(
+        id=job_id,
+        name=name,
+        group=group,
+        project=project,
+        href=href,
+        permalink=permalink,
+    )
+
+
 def _parse_execution_output(execution_id: int, data: dict[str, Any]) -> ExecutionOutput:
     """Parse execution output data from API response.
 
@@ -191,9 +358,8 @@ def _parse_execution_output(execution_id: int, data: dict[str, Any]) -> Executio
     Returns:
         Parsed ExecutionOutput model
     """
-    # Parse log entries
-    entries_data = data.get("entries", [])
-    entries = [_parse_log_entry(entry) for entry in entries_data]
+    # Parse all log entries in a single validator call
+    entries = LOG_ENTRIES_ADAPTER.validate_python(data.get("entries", []))
 
     return ExecutionOutput(
         id=execution_id,
@@ -207,23 +373,3 @@ def _parse_execution_output(execution_id: int, data: dict[str, Any]) -> Executio
         total_size=data.get("totalSize"),
         entries=entries,
     )
-
-
-def _parse_log_entry(data: dict[str, Any]) -> LogEntry:
-    """Parse a log entry from API response.
-
-    Args:
-        data: Raw log entry data
-
-    Returns:
-        Parsed LogEntry model
-    """
-    return LogEntry(
-        time=data.get("time"),
-        absolute_time=data.get("absolute_time"),
-        level=data.get("level", "NORMAL"),
-        log=data.get("log", ""),
-        node=data.get("node"),
-        step=data.get("stepctx"),
-        user=data.get("user"),
-    )
@@ -1,7 +1,13 @@
-from typing import Any
+import os
+import threading
+import time
+from typing import Annotated, Any
 
-from rundeck_mcp.client import get_client
+from pydantic import Field
+
+from rundeck_mcp.client import RundeckClient, get_client
 from rundeck_mcp.models import (
+    BatchJobRunRequest,
     Job,
     JobOption,
     JobQuery,
@@ -9,21 +15,98 @@ from rundeck_mcp.models import (
     JobRunRequest,
     JobRunResponse,
 )
-from rundeck_mcp.utils import validate_job_options
+from rundeck_mcp.utils import enforced_value_sets, validate_job_options
+
+# Job details option row templates, selected once per option by its allowed values
+_DETAIL_ROW_FREE = "| %d | **%s** | %s | %s | Any |"
+_DETAIL_ROW_LISTED = "| %d | **%s** | %s | %s | %s |"
+_DETAIL_ROW_ENFORCED = "| %d | **%s** | %s | %s | %s *(enforced)* |"
+_DETAIL_ROW_DESCRIPTION = "\n|   | ↳ _%s_ |   |   |   |"
+
+# Cell labels indexed by a boolean field, e.g. _REQUIRED_LABEL[opt.required]
+_REQUIRED_LABEL = ("No", "🔴 Yes")
+_REQUIRED_LABEL_BOLD = ("No", "🔴 **Yes**")
+_ENABLED_LABEL = ("No", "Yes")
+_SCHEDULE_LABEL = ("Yes (disabled)", "Yes (enabled)")
+
+# Placeholder for empty table cells
+_DASH = "-"
+
+# Fixed markdown table headers and trailers, shared by every call of the formatters
+_JOBS_TABLE_NOTICE = "IMPORTANT: Display this markdown table exactly as shown - do not summarize or reformat.\n\n"
+_JOBS_TABLE_HEADER = "| # | Name | Group | Job ID |\n|---|------|-------|--------|\n"
+_JOBS_TABLE_TRAILER = "\n---\nSTOP: You must show the table above to the user exactly as formatted. Do not summarize."
+_OPTIONS_TABLE_HEADER = (
+    "| # | Option | Required | Default | Allowed Values |\n|---|--------|----------|---------|----------------|\n"
+)
+_PREVIEW_TABLE_HEADER = "| Option | Value | Default | Required |\n|--------|-------|---------|----------|\n"
+_VALIDATION_TABLE_HEADER = (
+    "| Option | Required | Default | Allowed Values | Your Value |\n"
+    "|--------|----------|---------|----------------|------------|\n"
+)
+_BATCH_PREVIEW_TABLE_HEADER = "| # | Job | Job ID | Options |\n|---|-----|--------|---------|\n"
+_BATCH_RESULT_TABLE_HEADER = "| # | Job | Execution ID | Status |\n|---|-----|--------------|--------|\n"
+_RUN_PREVIEW_TRAILER = (
+    "---\n"
+    "**Ask the user:** Ready to run this job with these options?\n"
+    "- To proceed: call run_job again with `confirmed=True`\n"
+    "- To modify: ask user which options to change, then call run_job with new values\n\n"
+    "STOP: Show this table to user and wait for their confirmation before executing."
+)
+_RUN_BY_INDEX_PREVIEW_TRAILER = (
+    "---\n"
+    "**Ask the user:** Ready to run this job with these options?\n"
+    '- To proceed: call run_job_by_index again with `confirmed=True` and `job_id="%s"`\n'
+    "- To modify: ask user which options to change, then call run_job_by_index with new values\n\n"
+    "STOP: Show this table to user and wait for their confirmation before executing."
+)
+_BATCH_PREVIEW_TRAILER = (
+    "---\n"
+    "**Ask the user:** Ready to run these jobs with these options?\n"
+    "- To proceed: call run_jobs again with `confirmed=True`\n"
+    "- To modify: ask user which jobs or options to change, then call run_jobs with new values\n\n"
+    "STOP: Show this table to user and wait for their confirmation before executing."
+)
+_EXECUTION_FOLLOW_UP = "*Use get_execution to check status, or get_execution_output to view logs.*"
 
+# Seconds to reuse a fetched job definition across job tool calls (0 disables)
+JOB_CACHE_TTL = float(os.getenv("RUNDECK_JOB_CACHE_TTL", "30"))
+JOB_CACHE_SIZE = 512
 
-def list_jobs(query: JobQuery) -> str:
+# Option tables list at most this many options, bounding output on very large jobs
+MAX_DISPLAYED_OPTIONS = 50
+
+# (client identity, job ID) -> (expiry, raw job definition, enforced option value sets)
+_JOB_CACHE: dict[tuple[str, str], tuple[float, dict[str, Any], dict[str, frozenset[str]]]] = {}
+_JOB_CACHE_LOCK = threading.Lock()
+
+# (client identity, project) -> row number -> job ID from the latest list_jobs table, for run_job_by_index
+_LAST_LISTING: dict[tuple[str, str], dict[int, str]] = {}
+
+
+def list_jobs(
+    query: JobQuery,
+    max_render: Annotated[int, Field(ge=1, description="Maximum number of jobs to show in the table")] = 200,
+) -> str:
     """List jobs in a Rundeck project with optional filtering.
 
     Returns a numbered markdown table of jobs. Use the # column to reference
-    jobs in subsequent commands (e.g., "run job 3").
+    jobs in subsequent commands (e.g., "run job 3" with run_job_by_index). Results are paginated by
+    the query's limit and offset; when a full page is returned, the table ends
+    with the offset of the next page. Only the first max_render jobs of a page
+    are shown; the table notes how many more matched, and the next page starts
+    right after the last job shown.
 
     Args:
         query: Query parameters for filtering jobs
+        max_render: Maximum number of jobs to show in the table, at least 1
 
     Returns:
         Markdown table with numbered jobs
 
+    Raises:
+        ValueError: If max_render is less than 1
+
     Examples:
         List all jobs in a project:
         >>> result = list_jobs(JobQuery(project="myproject"))
@@ -33,7 +116,14 @@ def list_jobs(query: JobQuery) -> str:
 
         Search by name:
         >>> result = list_jobs(JobQuery(project="myproject", job_filter="backup"))
+
+        Get the second page of 50 jobs:
+        >>> result = list_jobs(JobQuery(project="myproject", limit=50, offset=50))
     """
+    # The schema bound only applies to MCP calls; a negative slice would silently drop the last rows
+    if max_render < 1:
+        raise ValueError(f"max_render must be at least 1, got {max_render}")
+
     client = get_client()
     params = query.to_params()
 
@@ -42,11 +132,18 @@ def list_jobs(query: JobQuery) -> str:
     if not response:
         return "No jobs found."
 
-    jobs = []
-    for job_data in response:
-        jobs.append(_parse_job(job_data))
+    # Only jobs that will be shown are parsed; map() resolves the parser once
+    jobs = list(map(_parse_job_dict, response[:max_render]))
+    _remember_listing(client, query.project, jobs, start=query.offset + 1)
+
+    # A full page means Rundeck may have more jobs after it; jobs hidden by max_render go on the next page
+    next_offset = None
+    if len(jobs) < len(response):
+        next_offset = query.offset + len(jobs)
+    elif len(response) >= query.limit:
+        next_offset = query.offset + len(response)
 
-    return _format_jobs_table(jobs)
+    return _format_jobs_table(jobs, hidden=len(response) - len(jobs), start=query.offset + 1, next_offset=next_offset)
 
 
 def get_job(job_id: str) -> str:
@@ -67,19 +164,38 @@ def get_job(job_id: str) -> str:
         '## Deploy Application...'
     """
     client = get_client()
-    response = client.get(f"/job/{job_id}")
+    job_response, _ = _get_cached_job(client, job_id)
+    return _format_job_details(_parse_job_dict(job_response))
 
-    # Handle list response (API returns list for single job lookup)
-    if isinstance(response, list):
-        if not response:
-            raise ValueError("Job not found")
-        response = response[0]
 
-    job = _parse_job(response)
-    return _format_job_details(job)
+async def get_jobs_bulk(job_ids: list[str]) -> str:
+    """Get detailed information about several jobs in one batch.
+
+    Works like get_job for each job, with all job definitions fetched
+    concurrently. Use it when comparing or reviewing several jobs at once.
+
+    Args:
+        job_ids: The job UUIDs
+
+    Returns:
+        Formatted job details with options tables, one section per job, in the given order
+
+    Examples:
+        >>> result = await get_jobs_bulk(["abc-123-def", "def-456-abc"])
+    """
+    client = get_client()
+    definitions = await _get_cached_jobs(client, job_ids)
+
+    return "\n\n---\n\n".join(_format_job_details(_parse_job_dict(definitions[job_id][0])) for job_id in job_ids)
 
 
-def run_job(job_id: str, request: JobRunRequest | None = None, *, confirmed: bool = False) -> str:
+def run_job(
+    job_id: str,
+    request: JobRunRequest | None = None,
+    *,
+    confirmed: bool = False,
+    refresh: bool = False,
+) -> str:
     """Execute a Rundeck job with optional parameters.
 
     IMPORTANT: This is a two-step process:
@@ -90,10 +206,14 @@ def run_job(job_id: str, request: JobRunRequest | None = None, *, confirmed: boo
     - All required options are provided (or have defaults)
     - Option values match allowed values for enforced options
 
+    The job definition fetched by the preview call is reused by the confirmed
+    call. Pass refresh=True to fetch it again, e.g. after editing the job.
+
     Args:
         job_id: The job UUID to execute
         request: Optional execution parameters including options
         confirmed: Set to True to actually execute (after user confirms)
+        refresh: Set to True to re-fetch the job definition instead of using the cached one
 
     Returns:
         Formatted string with options preview (step 1) or execution result (step 2)
@@ -108,29 +228,50 @@ def run_job(job_id: str, request: JobRunRequest | None = None, *, confirmed: boo
     """
     client = get_client()
 
-    # Fetch job to validate options
-    job_response = client.get(f"/job/{job_id}")
+    # Fetch job to validate options (reused from the preview call when fresh)
+    job_response, enforced_sets = _get_cached_job(client, job_id, refresh=refresh)
 
-    # Handle list response (API returns list for single job lookup)
-    if isinstance(job_response, list):
-        if not job_response:
-            raise ValueError("Job not found")
-        job_response = job_response[0]
+    return _run_fetched_job(client, job_id, job_response, enforced_sets, request, confirmed=confirmed)
+
+
+def _run_fetched_job(
+    client: RundeckClient,
+    job_id: str,
+    job_response: dict[str, Any],
+    enforced_sets: dict[str, frozenset[str]],
+    request: JobRunRequest | None,
+    *,
+    confirmed: bool,
+    preview_trailer: str = _RUN_PREVIEW_TRAILER,
+) -> str:
+    """Validate, preview or execute a job whose definition has been fetched.
 
-    job = _parse_job(job_response)
+    Args:
+        client: Rundeck client to use
+        job_id: The job UUID to execute
+        job_response: Raw job definition
+        enforced_sets: Enforced option value sets of the job
+        request: Optional execution parameters including options
+        confirmed: Set to True to actually execute
+        preview_trailer: Confirmation instructions ending the preview
+
+    Returns:
+        Formatted string with validation errors, options preview or execution result
+    """
     job_options = job_response.get("options")
 
     provided_options = request.options if request else None
 
     # Validate options
-    is_valid, errors = validate_job_options(job_options, provided_options)
+    is_valid, errors = validate_job_options(job_options, provided_options, enforced_sets=enforced_sets)
 
+    # The parsed job is only needed for display, not on the confirmed happy path
     if not is_valid:
-        return _format_validation_error(job, errors, provided_options)
+        return _format_validation_error(_parse_job_dict(job_response), errors, provided_options)
 
     # If not confirmed, show preview and ask for confirmation
     if not confirmed:
-        return _format_run_preview(job, provided_options)
+        return _format_run_preview(_parse_job_dict(job_response), provided_options, preview_trailer)
 
     # Build request body
     body = request.to_request_body() if request else {}
@@ -141,29 +282,304 @@ def run_job(job_id: str, request: JobRunRequest | None = None, *, confirmed: boo
     return _format_run_response(_parse_run_response(response))
 
 
-def _format_jobs_table(jobs: list[Job]) -> str:
-    """Format jobs as a numbered markdown table.
+def run_job_by_index(
+    index: int,
+    project: str,
+    request: JobRunRequest | None = None,
+    *,
+    job_id: str | None = None,
+    confirmed: bool = False,
+    refresh: bool = False,
+) -> str:
+    """Execute a job by its # in the most recent list_jobs table of a project.
+
+    Resolves the row number shown by list_jobs to the job UUID and runs it
+    like run_job, so "run job 3" does not need the project to be listed again.
+    Row numbers are remembered per Rundeck credentials and project, and the job
+    definition is checked to belong to that project before anything runs.
+
+    The same two-step preview and confirmation flow applies. The preview shows
+    the resolved job UUID, and the confirmed call must pass it back as job_id:
+    if a list_jobs call in between renumbered the table, nothing runs.
 
     Args:
-        jobs: List of Job objects to format
+        index: The # of the job in the last list_jobs table
+        project: The project that was listed
+        request: Optional execution parameters including options
+        job_id: The job UUID shown by the preview, required with confirmed=True
+        confirmed: Set to True to actually execute (after user confirms)
+        refresh: Set to True to re-fetch the job definition instead of using the cached one
 
     Returns:
-        Markdown table string with numbered jobs
+        Formatted string with options preview (step 1) or execution result (step 2)
+
+    Raises:
+        ValueError: If the index is not in the last list_jobs table of the project,
+            the job no longer belongs to the project, or a confirmed call's job_id
+            is not the job the index now refers to
+
+    Examples:
+        Step 1 - Preview job #3:
+        >>> list_jobs(JobQuery(project="myproject"))
+        >>> result = run_job_by_index(3, "myproject", JobRunRequest(options={"env": "prod"}))
+
+        Step 2 - Execute the previewed job after confirmation:
+        >>> result = run_job_by_index(
+        ...     3, "myproject", JobRunRequest(options={"env": "prod"}), job_id="abc-123-def", confirmed=True
+        ... )
+    """
+    client = get_client()
+
+    with _JOB_CACHE_LOCK:
+        resolved_id = _LAST_LISTING.get((client.identity, project), {}).get(index)
+    if resolved_id is None:
+        raise ValueError(f"No job #{index} in the last list_jobs result for project '{project}'. Call list_jobs first.")
+    if confirmed and job_id != resolved_id:
+        if job_id is None:
+            raise ValueError(f"Confirming job #{index} requires the job_id shown in its preview.")
+        raise ValueError(
+            f"Job #{index} of project '{project}' now refers to {resolved_id}, not the previewed job {job_id}. "
+            "Preview it again without confirmed=True."
+        )
+    job_id = resolved_id
+
+    job_response, enforced_sets = _get_cached_job(client, job_id, refresh=refresh)
+    if job_response.get("project", project) != project:
+        raise ValueError(f"Job {job_id} is not in project '{project}'. Call list_jobs again.")
+
+    return _run_fetched_job(
+        client,
+        job_id,
+        job_response,
+        enforced_sets,
+        request,
+        confirmed=confirmed,
+        preview_trailer=_RUN_BY_INDEX_PREVIEW_TRAILER % job_id,
+    )
+
+
+async def run_jobs(runs: list[BatchJobRunRequest], *, confirmed: bool = False) -> str:
+    """Execute several Rundeck jobs in one batch.
+
+    Works like run_job for multiple jobs, using the same two-step process:
+    1. First call without confirmed=True validates every job and asks for confirmation
+    2. Second call with confirmed=True starts all executions concurrently
+
+    Nothing is executed unless the options of every job in the batch are valid.
+
+    Args:
+        runs: Jobs to execute, each with its job_id and optional execution parameters
+        confirmed: Set to True to actually execute (after user confirms)
+
+    Returns:
+        Formatted string with validation errors, batch preview (step 1) or execution results (step 2)
+
+    Examples:
+        Step 1 - Preview the batch:
+        >>> result = await run_jobs([
+        ...     BatchJobRunRequest(job_id="abc-123-def", options={"env": "prod"}),
+        ...     BatchJobRunRequest(job_id="def-456-abc"),
+        ... ])
+
+        Step 2 - Execute after confirmation:
+        >>> result = await run_jobs([...], confirmed=True)
+    """
+    client = get_client()
+    definitions = await _get_cached_jobs(client, [run.job_id for run in runs])
+
+    jobs = []
+    failures = []
+    for run in runs:
+        job_response, enforced_sets = definitions[run.job_id]
+        job = _parse_job_dict(job_response)
+        is_valid, errors = validate_job_options(job_response.get("options"), run.options, enforced_sets=enforced_sets)
+        if not is_valid:
+            failures.append(_format_validation_error(job, errors, run.options))
+        jobs.append(job)
+
+    if failures:
+        return "\n\n".join(failures)
+
+    # If not confirmed, show preview and ask for confirmation
+    if not confirmed:
+        return _format_batch_preview(jobs, runs)
+
+    responses = await client.post_many([(f"/job/{run.job_id}/run", run.to_request_body()) for run in runs])
+
+    return _format_batch_response(jobs, responses)
+
+
+def _fetch_job_definition(client: RundeckClient, job_id: str) -> dict[str, Any]:
+    """Fetch the raw job definition for a job.
+
+    Args:
+        client: Rundeck client to use
+        job_id: The job UUID
+
+    Returns:
+        Raw job definition from the API
+
+    Raises:
+        ValueError: If the job does not exist
+    """
+    return _unwrap_job_response(client.get(f"/job/{job_id}"))
+
+
+def _unwrap_job_response(response: dict[str, Any] | list) -> dict[str, Any]:
+    """Get the job definition from a single job lookup response.
+
+    Args:
+        response: Raw API response data
+
+    Returns:
+        Raw job definition
+
+    Raises:
+        ValueError: If the response holds no job
+    """
+    # Handle list response (API returns list for single job lookup)
+    if isinstance(response, list):
+        if not response:
+            raise ValueError("Job not found")
+        response = response[0]
+
+    return response
+
+
+def clear_job_cache() -> None:
+    """Clear the job definitions and list_jobs row numbers cached by the job tools."""
+    with _JOB_CACHE_LOCK:
+        _JOB_CACHE.clear()
+        _LAST_LISTING.clear()
+
+
+def _remember_listing(client: RundeckClient, project: str, jobs: list[Job], start: int) -> None:
+    """Replace the row number to job ID mapping of a project with the jobs of a new listing."""
+    rows = {idx: job.id for idx, job in enumerate(jobs, start=start)}
+    with _JOB_CACHE_LOCK:
+        _LAST_LISTING[(client.identity, project)] = rows
+
+
+def _get_cached_job(
+    client: RundeckClient,
+    job_id: str,
+    *,
+    refresh: bool = False,
+) -> tuple[dict[str, Any], dict[str, frozenset[str]]]:
+    """Get a job definition, reusing a cached copy for up to JOB_CACHE_TTL seconds.
+
+    Args:
+        client: Rundeck client to use
+        job_id: The job UUID
+        refresh: Skip the cached copy and fetch the job again
+
+    Returns:
+        Tuple of (raw job definition, enforced option value sets)
+
+    Raises:
+        ValueError: If the job does not exist
+    """
+    cached = None if refresh else _cached_job(client, job_id)
+    if cached is not None:
+        return cached
+    return _cache_job(client, job_id, _fetch_job_definition(client, job_id))
+
+
+async def _get_cached_jobs(
+    client: RundeckClient,
+    job_ids: list[str],
+) -> dict[str, tuple[dict[str, Any], dict[str, frozenset[str]]]]:
+    """Get several job definitions, fetching only the ones missing from the cache in one batch.
+
+    Args:
+        client: Rundeck client to use
+        job_ids: The job UUIDs; repeated IDs are fetched once
+
+    Returns:
+        Mapping of job UUID to (raw job definition, enforced option value sets)
+
+    Raises:
+        ValueError: If a job does not exist
+        httpx.HTTPError: If fetching a job definition fails
     """
-    lines = []
-    lines.append("IMPORTANT: Display this markdown table exactly as shown - do not summarize or reformat.\n")
-    lines.append(f"**{len(jobs)} jobs found.** Use # to reference jobs (e.g., 'run job 3'):\n")
-    lines.append("| # | Name | Group | Job ID |")
-    lines.append("|---|------|-------|--------|")
+    definitions = {job_id: _cached_job(client, job_id) for job_id in job_ids}
+    missing = [job_id for job_id, cached in definitions.items() if cached is None]
+    responses = await client.get_many([(f"/job/{job_id}", None) for job_id in missing]) if missing else []
+
+    for job_id, response in zip(missing, responses, strict=True):
+        if isinstance(response, BaseException):
+            raise response
+        definitions[job_id] = _cache_job(client, job_id, _unwrap_job_response(response))
+
+    return definitions
 
-    for idx, job in enumerate(jobs, start=1):
-        group = job.group or "-"
-        lines.append(f"| {idx} | {job.name} | {group} | {job.id} |")
 
-    lines.append("\n---")
-    lines.append("STOP: You must show the table above to the user exactly as formatted. Do not summarize.")
+def _cached_job(client: RundeckClient, job_id: str) -> tuple[dict[str, Any], dict[str, frozenset[str]]] | None:
+    """Look up a fresh cached job definition.
+
+    Returns:
+        Tuple of (raw job definition, enforced option value sets), or None if not cached or expired
+    """
+    with _JOB_CACHE_LOCK:
+        cached = _JOB_CACHE.get((client.identity, job_id))
+    if cached is None or cached[0] <= time.monotonic():
+        return None
+    return cached[1:]
 
-    return "\n".join(lines)
+
+def _cache_job(
+    client: RundeckClient,
+    job_id: str,
+    job_response: dict[str, Any],
+) -> tuple[dict[str, Any], dict[str, frozenset[str]]]:
+    """Cache a fetched job definition, evicting the oldest entry beyond JOB_CACHE_SIZE.
+
+    Returns:
+        Tuple of (raw job definition, enforced option value sets)
+    """
+    enforced_sets = enforced_value_sets(job_response.get("options"))
+    if JOB_CACHE_TTL > 0:
+        key = (client.identity, job_id)
+        with _JOB_CACHE_LOCK:
+            _JOB_CACHE.pop(key, None)
+            _JOB_CACHE[key] = (time.monotonic() + JOB_CACHE_TTL, job_response, enforced_sets)
+            if len(_JOB_CACHE) > JOB_CACHE_SIZE:
+                del _JOB_CACHE[next(iter(_JOB_CACHE))]
+    return job_response, enforced_sets
+
+
+def _format_jobs_table(
+    jobs: list[Job],
+    hidden: int = 0,
+    start: int = 1,
+    next_offset: int | None = None,
+) -> str:
+    """Format jobs as a numbered markdown table.
+
+    Args:
+        jobs: List of Job objects to format
+        hidden: Number of further matching jobs left out of the table
+        start: Number of the first job, to continue numbering across pages
+        next_offset: Offset of the next page, if there may be one
+
+    Returns:
+        Markdown table string with numbered jobs
+    """
+    # Rows are streamed straight into one join rather than collected in a list first
+    rows = "".join(
+        f"| {idx} | {job.name} | {job.group or _DASH} | {job.id} |\n" for idx, job in enumerate(jobs, start=start)
+    )
+    more = ""
+    if hidden:
+        more = f"\n*+ {hidden} more jobs not shown. Refine the query (e.g., job_filter or group_path) to see them.*\n"
+    if next_offset is not None:
+        more += f"\n*More jobs may be available: call list_jobs again with offset={next_offset} for the next page.*\n"
+
+    return (
+        f"{_JOBS_TABLE_NOTICE}"
+        f"**{len(jobs) + hidden} jobs found.** Use # to reference jobs (e.g., 'run job 3'):\n\n"
+        f"{_JOBS_TABLE_HEADER}{rows}{more}{_JOBS_TABLE_TRAILER}"
+    )
 
 
 def _format_job_details(job: Job) -> str:
@@ -175,124 +591,114 @@ def _format_job_details(job: Job) -> str:
     Returns:
         Formatted string with job info and options table
     """
-    lines = []
-    lines.append(f"## {job.name}")
-    lines.append("")
-
-    if job.description:
-        lines.append(f"{job.description}")
-        lines.append("")
-
-    lines.append(f"**Job ID:** `{job.id}`")
-    if job.project:
-        lines.append(f"**Project:** {job.project}")
-    if job.group:
-        lines.append(f"**Group:** {job.group}")
-    lines.append(f"**Enabled:** {'Yes' if job.enabled else 'No'}")
+    description = f"{job.description}\n\n" if job.description else ""
+    project = f"**Project:** {job.project}\n" if job.project else ""
+    group = f"**Group:** {job.group}\n" if job.group else ""
+    scheduled = ""
     if job.scheduled:
-        lines.append(f"**Scheduled:** {'Yes (enabled)' if job.schedule_enabled else 'Yes (disabled)'}")
-    lines.append("")
+        scheduled = f"**Scheduled:** {_SCHEDULE_LABEL[job.schedule_enabled]}\n"
 
     # Options table
     if job.options:
-        lines.append("### Job Options")
-        lines.append("")
-        lines.append("| # | Option | Required | Default | Allowed Values |")
-        lines.append("|---|--------|----------|---------|----------------|")
+        shown = job.options[:MAX_DISPLAYED_OPTIONS]
+        rows = "\n".join(_format_option_detail_row(idx, opt) for idx, opt in enumerate(shown, start=1))
+
+        # Summary of what's needed
+        required = ""
+        required_names = [o.name for o in job.options if o.required and not o.value]
+        if required_names:
+            required = "**⚠️ Required options (no default):** " + ", ".join(f"`{n}`" for n in required_names) + "\n\n"
+
+        hidden = _format_hidden_options(job.options)
+        options = f"### Job Options\n\n{_OPTIONS_TABLE_HEADER}{rows}\n\n{hidden}{required}"
+    else:
+        options = "*This job has no options - it can be run directly.*\n\n"
 
-        for idx, opt in enumerate(job.options, start=1):
-            required = "🔴 Yes" if opt.required else "No"
-            default = f"`{opt.value}`" if opt.value else "-"
+    link = f"[View in Rundeck]({job.permalink})\n\n" if job.permalink else ""
 
-            if opt.values:
-                if len(opt.values) <= 5:
-                    allowed = ", ".join(f"`{v}`" for v in opt.values)
-                else:
-                    allowed = ", ".join(f"`{v}`" for v in opt.values[:3]) + f" ... ({len(opt.values)} total)"
-                if opt.enforced:
-                    allowed += " *(enforced)*"
-            else:
-                allowed = "Any"
+    return (
+        f"## {job.name}\n\n{description}"
+        f"**Job ID:** `{job.id}`\n{project}{group}"
+        f"**Enabled:** {_ENABLED_LABEL[job.enabled]}\n{scheduled}\n"
+        f"{options}{link}"
+        "*To run this job, use: run_job with the job_id and required options.*"
+    )
 
-            lines.append(f"| {idx} | **{opt.name}** | {required} | {default} | {allowed} |")
 
-            # Add description as sub-row if present
-            if opt.description:
-                lines.append(f"|   | ↳ _{opt.description}_ |   |   |   |")
+def _format_hidden_options(options: list[JobOption]) -> str:
+    """Format the note for options left out of a table by MAX_DISPLAYED_OPTIONS."""
+    hidden = len(options) - MAX_DISPLAYED_OPTIONS
+    return f"*...and {hidden} more options not shown.*\n\n" if hidden > 0 else ""
 
-        lines.append("")
 
-        # Summary of what's needed
-        required_opts = [o for o in job.options if o.required and not o.value]
-        if required_opts:
-            lines.append("**⚠️ Required options (no default):** " + ", ".join(f"`{o.name}`" for o in required_opts))
-            lines.append("")
+def _format_option_detail_row(idx: int, opt: JobOption) -> str:
+    """Format one option of the job details table, with its description sub-row."""
+    required = _REQUIRED_LABEL[opt.required]
+    default = f"`{opt.value}`" if opt.value else _DASH
+
+    if not opt.values:
+        row = _DETAIL_ROW_FREE % (idx, opt.name, required, default)
     else:
-        lines.append("*This job has no options - it can be run directly.*")
-        lines.append("")
+        template = _DETAIL_ROW_ENFORCED if opt.enforced else _DETAIL_ROW_LISTED
+        row = template % (idx, opt.name, required, default, _format_allowed_values(opt.values))
 
-    if job.permalink:
-        lines.append(f"[View in Rundeck]({job.permalink})")
-        lines.append("")
+    # Add description as sub-row if present
+    if opt.description:
+        row += _DETAIL_ROW_DESCRIPTION % opt.description
+    return row
 
-    lines.append("*To run this job, use: run_job with the job_id and required options.*")
 
-    return "\n".join(lines)
+def _format_allowed_values(values: list[str]) -> str:
+    """Format an allowed values list for the job details table, truncated after 5 values."""
+    if len(values) <= 5:
+        return ", ".join(f"`{v}`" for v in values)
+    return ", ".join(f"`{v}`" for v in values[:3]) + f" ... ({len(values)} total)"
 
 
-def _format_run_preview(job: Job, provided_options: dict[str, str] | None) -> str:
+def _format_run_preview(
+    job: Job,
+    provided_options: dict[str, str] | None,
+    trailer: str = _RUN_PREVIEW_TRAILER,
+) -> str:
     """Format job execution preview with options table for user confirmation.
 
     Args:
         job: The job to execute
         provided_options: Options that will be used
+        trailer: Confirmation instructions ending the preview
 
     Returns:
         Formatted preview asking user to confirm or modify options
     """
-    lines = []
-    lines.append(f"## 🚀 Ready to run: {job.name}")
-    lines.append("")
-
-    if job.description:
-        lines.append(f"_{job.description}_")
-        lines.append("")
+    description = f"_{job.description}_\n\n" if job.description else ""
 
     if job.options:
-        lines.append("### Options to be used:")
-        lines.append("")
-        lines.append("| Option | Value | Default | Required |")
-        lines.append("|--------|-------|---------|----------|")
-
-        for opt in job.options:
-            # Determine what value will be used
-            if provided_options and opt.name in provided_options:
-                value = f"✅ `{provided_options[opt.name]}`"
-            elif opt.value:
-                value = f"_(default)_ `{opt.value}`"
-            elif opt.required:
-                value = "❌ **MISSING**"
-            else:
-                value = "_(none)_"
-
-            default = f"`{opt.value}`" if opt.value else "-"
-            required = "🔴 Yes" if opt.required else "No"
-
-            lines.append(f"| **{opt.name}** | {value} | {default} | {required} |")
-
-        lines.append("")
+        shown = job.options[:MAX_DISPLAYED_OPTIONS]
+        rows = "".join(_format_option_preview_row(opt, provided_options) for opt in shown)
+        hidden = _format_hidden_options(job.options)
+        options = f"### Options to be used:\n\n{_PREVIEW_TABLE_HEADER}{rows}\n{hidden}"
     else:
-        lines.append("_This job has no options._")
-        lines.append("")
+        options = "_This job has no options._\n\n"
 
-    lines.append("---")
-    lines.append("**Ask the user:** Ready to run this job with these options?")
-    lines.append("- To proceed: call run_job again with `confirmed=True`")
-    lines.append("- To modify: ask user which options to change, then call run_job with new values")
-    lines.append("")
-    lines.append("STOP: Show this table to user and wait for their confirmation before executing.")
+    return f"## 🚀 Ready to run: {job.name}\n\n**Job ID:** `{job.id}`\n\n{description}{options}{trailer}"
 
-    return "\n".join(lines)
+
+def _format_option_preview_row(opt: JobOption, provided_options: dict[str, str] | None) -> str:
+    """Format one option of the run preview table, showing the value that will be used."""
+    # Determine what value will be used
+    if provided_options and opt.name in provided_options:
+        value = f"✅ `{provided_options[opt.name]}`"
+    elif opt.value:
+        value = f"_(default)_ `{opt.value}`"
+    elif opt.required:
+        value = "❌ **MISSING**"
+    else:
+        value = "_(none)_"
+
+    default = f"`{opt.value}`" if opt.value else _DASH
+    required = _REQUIRED_LABEL[opt.required]
+
+    return f"| **{opt.name}** | {value} | {default} | {required} |\n"
 
 
 def _format_validation_error(job: Job, errors: list[str], provided_options: dict[str, str] | None) -> str:
@@ -306,50 +712,48 @@ def _format_validation_error(job: Job, errors: list[str], provided_options: dict
     Returns:
         Formatted error message with options table
     """
-    lines = []
-    lines.append(f"## ❌ Cannot run '{job.name}'")
-    lines.append("")
-    lines.append("**Validation errors:**")
-    for err in errors:
-        lines.append(f"- {err}")
-    lines.append("")
+    error_lines = "".join(f"- {err}\n" for err in errors)
 
+    options = ""
     if job.options:
-        lines.append("### Options Required")
-        lines.append("")
-        lines.append("| Option | Required | Default | Allowed Values | Your Value |")
-        lines.append("|--------|----------|---------|----------------|------------|")
-
-        for opt in job.options:
-            required = "🔴 **Yes**" if opt.required else "No"
-            default = f"`{opt.value}`" if opt.value else "-"
-            provided_val = provided_options.get(opt.name) if provided_options else None
-            provided = f"`{provided_val}`" if provided_val else "-"
-
-            if opt.values:
-                if len(opt.values) <= 4:
-                    allowed = ", ".join(f"`{v}`" for v in opt.values)
-                else:
-                    allowed = ", ".join(f"`{v}`" for v in opt.values[:3]) + f" +{len(opt.values) - 3} more"
-                if opt.enforced:
-                    allowed += " *(must match)*"
-            else:
-                allowed = "Any value"
-
-            lines.append(f"| **{opt.name}** | {required} | {default} | {allowed} | {provided} |")
-
-        lines.append("")
+        shown = job.options[:MAX_DISPLAYED_OPTIONS]
+        rows = "\n".join(_format_option_input_row(opt, provided_options) for opt in shown)
+        hidden = _format_hidden_options(job.options)
+        options = f"### Options Required\n\n{_VALIDATION_TABLE_HEADER}{rows}\n\n{hidden}"
 
     # Clear call to action
+    missing = ""
     missing_required = [o for o in (job.options or []) if o.required and not o.value]
     if missing_required:
         names = ", ".join(f"`{o.name}`" for o in missing_required)
-        lines.append(f"**Please provide values for:** {names}")
-        lines.append("")
+        missing = f"**Please provide values for:** {names}\n\n"
+
+    return (
+        f"## ❌ Cannot run '{job.name}'\n\n"
+        f"**Validation errors:**\n{error_lines}\n"
+        f"{options}{missing}"
+        "*Ask the user for the missing option values, then retry with run_job.*"
+    )
 
-    lines.append("*Ask the user for the missing option values, then retry with run_job.*")
 
-    return "\n".join(lines)
+def _format_option_input_row(opt: JobOption, provided_options: dict[str, str] | None) -> str:
+    """Format one option of the validation error table, with the value the user gave."""
+    required = _REQUIRED_LABEL_BOLD[opt.required]
+    default = f"`{opt.value}`" if opt.value else _DASH
+    provided_val = provided_options.get(opt.name) if provided_options else None
+    provided = f"`{provided_val}`" if provided_val else _DASH
+
+    if opt.values:
+        if len(opt.values) <= 4:
+            allowed = ", ".join(f"`{v}`" for v in opt.values)
+        else:
+            allowed = ", ".join(f"`{v}`" for v in opt.values[:3]) + f" +{len(opt.values) - 3} more"
+        if opt.enforced:
+            allowed += " *(must match)*"
+    else:
+        allowed = "Any value"
+
+    return f"| **{opt.name}** | {required} | {default} | {allowed} | {provided} |"
 
 
 def _format_run_response(response: JobRunResponse) -> str:
@@ -361,87 +765,96 @@ def _format_run_response(response: JobRunResponse) -> str:
     Returns:
         Formatted success message
     """
-    lines = []
-    lines.append(f"## ✅ Job Started: {response.job.name}")
-    lines.append("")
-    lines.append(f"**Execution ID:** `{response.id}`")
-    lines.append(f"**Status:** {response.status}")
-    lines.append(f"**Project:** {response.project}")
-    lines.append(f"**Started by:** {response.user}")
-    if response.argstring:
-        lines.append(f"**Options:** `{response.argstring}`")
-    lines.append("")
-    if response.permalink:
-        lines.append(f"[View Execution in Rundeck]({response.permalink})")
-        lines.append("")
-    lines.append("*Use get_execution to check status, or get_execution_output to view logs.*")
-
-    return "\n".join(lines)
-
-
-def _parse_job(data: dict[str, Any] | list) -> Job:
-    """Parse job data from API response.
-
-    Handles both single job responses (dict) and list responses.
-    Converts option data to JobOption models.
+    options = f"**Options:** `{response.argstring}`\n" if response.argstring else ""
+    link = f"[View Execution in Rundeck]({response.permalink})\n\n" if response.permalink else ""
+
+    return (
+        f"## ✅ Job Started: {response.job.name}\n\n"
+        f"**Execution ID:** `{response.id}`\n"
+        f"**Status:** {response.status}\n"
+        f"**Project:** {response.project}\n"
+        f"**Started by:** {response.user}\n"
+        f"{options}\n{link}{_EXECUTION_FOLLOW_UP}"
+    )
+
+
+def _format_batch_preview(jobs: list[Job], runs: list[BatchJobRunRequest]) -> str:
+    """Format a batch execution preview for user confirmation.
 
     Args:
-        data: Raw API response data
+        jobs: The jobs to execute, in batch order
+        runs: The batch run requests, in the same order
 
     Returns:
-        Parsed Job model
+        Formatted preview asking user to confirm the batch
     """
-    # Handle list response (take first item)
-    if isinstance(data, list):
-        if not data:
-            raise ValueError("Empty job response")
-        data = data[0]
-
-    # Parse options if present
-    options = None
-    if data.get("options"):
-        options = [_parse_job_option(opt) for opt in data["options"]]
-
-    return Job(
-        id=data["id"],
-        name=data["name"],
-        group=data.get("group"),
-        project=data.get("project"),  # May be None from /job/{id} endpoint
-        description=data.get("description"),
-        href=data.get("href"),
-        permalink=data.get("permalink"),
-        scheduled=data.get("scheduled", False),
-        schedule_enabled=data.get("scheduleEnabled", True),
-        enabled=data.get("enabled", True),
-        average_duration=data.get("averageDuration"),
-        options=options,
+    rows = "".join(
+        f"| {idx} | **{job.name}** | {job.id} | {_format_run_options(run)} |\n"
+        for idx, (job, run) in enumerate(zip(jobs, runs, strict=True), start=1)
     )
 
+    return f"## 🚀 Ready to run {len(jobs)} jobs\n\n{_BATCH_PREVIEW_TABLE_HEADER}{rows}\n{_BATCH_PREVIEW_TRAILER}"
+
+
+def _format_run_options(run: BatchJobRunRequest) -> str:
+    """Format the options of one batch run for the preview table."""
+    if not run.options:
+        return "_(defaults)_"
+    return ", ".join(f"`{name}={value}`" for name, value in run.options.items())
+
 
-def _parse_job_option(data: dict[str, Any]) -> JobOption:
-    """Parse a job option from API response.
+def _format_batch_response(jobs: list[Job], responses: list[Any]) -> str:
+    """Format the results of a batch execution.
 
     Args:
-        data: Raw option data from API
+        jobs: The jobs that were executed, in batch order
+        responses: Raw run responses (or the exception raised), in the same order
 
     Returns:
-        Parsed JobOption model
+        Formatted table of started executions and failures
     """
-    return JobOption(
-        name=data["name"],
-        description=data.get("description"),
-        required=data.get("required", False),
-        value=data.get("value"),
-        values=data.get("values"),
-        enforced=data.get("enforced", False),
-        multivalued=data.get("multivalued", False),
-        delimiter=data.get("delimiter"),
-        secure=data.get("secure", False),
-        storage_path=data.get("storagePath"),
-        option_type=data.get("type"),
+    started = sum(1 for response in responses if not isinstance(response, BaseException))
+    rows = "".join(
+        _format_batch_response_row(idx, job, response)
+        for idx, (job, response) in enumerate(zip(jobs, responses, strict=True), start=1)
+    )
+
+    return (
+        f"## {'✅' if started == len(jobs) else '⚠️'} Started {started} of {len(jobs)} jobs\n\n"
+        f"{_BATCH_RESULT_TABLE_HEADER}{rows}\n{_EXECUTION_FOLLOW_UP}"
     )
 
 
+def _format_batch_response_row(idx: int, job: Job, response: Any) -> str:
+    """Format one row of the batch results table, for a started run or a failure."""
+    if isinstance(response, BaseException):
+        return f"| {idx} | {job.name} | {_DASH} | ❌ {_format_error_cell(response)} |\n"
+    run_response = _parse_run_response(response)
+    return f"| {idx} | {job.name} | `{run_response.id}` | {run_response.status} |\n"
+
+
+def _format_error_cell(error: BaseException) -> str:
+    """Collapse an exception to one line that cannot break a markdown table cell."""
+    lines = str(error).strip().splitlines()
+    text = f"{type(error).__name__}: {lines[0]}" if lines else type(error).__name__
+    return text.replace("|", "\\|")
+
+
+def _parse_job_dict(data: dict[str, Any]) -> Job:
+    """Parse a single job definition from API response.
+
+    Field names and defaults come from the Job and JobOption aliases, so the
+    whole definition, options included, is validated in one pydantic-core call.
+
+    Args:
+        data: Raw job definition
+
+    Returns:
+        Parsed Job model
+    """
+    return Job.model_validate(data)
+
+
 def _parse_run_response(data: dict[str, Any]) -> JobRunResponse:
     """Parse job run response from API.
 
@@ -1,3 +1,5 @@
+from collections.abc import Mapping
+
 from rundeck_mcp.client import get_client
 from rundeck_mcp.models import MCPContext
 
@@ -18,9 +20,25 @@ def get_mcp_context() -> MCPContext:
     )
 
 
+def enforced_value_sets(job_options: list[dict] | None) -> dict[str, frozenset[str]]:
+    """Build the allowed value sets of a job's enforced options.
+
+    Args:
+        job_options: List of job option definitions from the job
+
+    Returns:
+        Mapping of enforced option name to its allowed values
+    """
+    return {
+        opt["name"]: frozenset(opt["values"]) for opt in job_options or [] if opt.get("enforced") and opt.get("values")
+    }
+
+
 def validate_job_options(
     job_options: list[dict] | None,
     provided_options: dict[str, str] | None,
+    *,
+    enforced_sets: Mapping[str, frozenset[str]] | None = None,
 ) -> tuple[bool, list[str]]:
     """Validate provided options against job option definitions.
 
@@ -32,6 +50,7 @@ def validate_job_options(
     Args:
         job_options: List of job option definitions from the job
         provided_options: Options provided for execution
+        enforced_sets: Precomputed enforced_value_sets(job_options), to reuse across calls
 
     Returns:
         Tuple of (is_valid, list_of_error_messages)
@@ -45,16 +64,14 @@ def validate_job_options(
         return len(errors) == 0, errors
 
     option_map = {opt["name"]: opt for opt in job_options}
-    option_names = set(option_map.keys())
 
-    # Check for unknown options
-    unknown = set(provided.keys()) - option_names
+    # Check for unknown options (dict key views support set operations directly)
+    unknown = provided.keys() - option_map.keys()
     if unknown:
-        errors.append(f"Unknown options: {sorted(unknown)}. Valid options: {sorted(option_names)}")
+        errors.append(f"Unknown options: {sorted(unknown)}. Valid options: {sorted(option_map)}")
 
     # Check required options
-    for opt in job_options:
-        name = opt["name"]
+    for name, opt in option_map.items():
         required = opt.get("required", False)
         default = opt.get("value")
 
@@ -62,16 +79,12 @@ def validate_job_options(
             errors.append(f"Required option '{name}' is missing")
 
     # Check enforced values
+    if enforced_sets is None:
+        enforced_sets = enforced_value_sets(job_options)
     for name, value in provided.items():
-        if name not in option_map:
-            continue
-
-        opt = option_map[name]
-        allowed_values = opt.get("values")
-        enforced = opt.get("enforced", False)
-
-        if enforced and allowed_values and value not in allowed_values:
-            errors.append(f"Option '{name}' value '{value}' is not in allowed values: {allowed_values}")
+        allowed = enforced_sets.get(name)
+        if allowed is not None and value not in allowed:
+            errors.append(f"Option '{name}' value '{value}' is not in allowed values: {option_map[name]['values']}")
 
     return len(errors) == 0, errors
 
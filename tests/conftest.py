@@ -0,0 +1,79 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from rundeck_mcp.tools.jobs import clear_job_cache
+
+# The RundeckClient attributes the job tools touch; spec_set stops the mock growing any others
+CLIENT_SPEC = ["base_url", "identity", "get", "post", "get_many", "post_many"]
+
+
+@pytest.fixture(scope="module")
+def patched_get_client():
+    """Patch the job tools' get_client once per test module that requests it.
+
+    Only modules that use mock_client or stub_client pull this in, so the patch never
+    reaches tests of the real client.
+    """
+    with patch("rundeck_mcp.tools.jobs.get_client", autospec=True) as mock_get_client:
+        mock_get_client.return_value = MagicMock(spec_set=CLIENT_SPEC)
+        # The job cache keys on identity, so it must stay hashable across resets
+        mock_get_client.return_value.base_url = "http://rundeck.local"
+        mock_get_client.return_value.identity = ("http://rundeck.local", "test-token")
+        yield mock_get_client
+
+
+@pytest.fixture
+def mock_client(patched_get_client):
+    """Provide the shared client mock, reset and with an empty job cache, to one test."""
+    client = patched_get_client.return_value
+    client.reset_mock(return_value=True, side_effect=True)
+    clear_job_cache()
+    yield client
+    clear_job_cache()
+
+
+class StubClient:
+    """Minimal RundeckClient stand-in that returns fixed responses and records its calls."""
+
+    base_url = "http://rundeck.local"
+    token = "test-token"
+
+    def __init__(self, get_ret=None, post_ret=None):
+        self.get_ret = get_ret
+        self.post_ret = post_ret
+        self.get_calls = []
+        self.post_calls = []
+
+    @property
+    def identity(self):
+        """Mirror RundeckClient.identity, with the token kept in the clear."""
+        return (self.base_url, self.token)
+
+    def get(self, path, params=None):
+        """Record a GET and return the fixed response."""
+        self.get_calls.append((path, params))
+        return self.get_ret
+
+    def post(self, path, json=None):
+        """Record a POST and return the fixed response."""
+        self.post_calls.append((path, json))
+        return self.post_ret
+
+
+@pytest.fixture
+def stub_client(patched_get_client):
+    """Install a StubClient as the job tools' client for one test.
+
+    Call the fixture with the responses to return; it gives back the stub.
+    """
+    shared_mock = patched_get_client.return_value
+
+    def install(get_ret=None, post_ret=None):
+        patched_get_client.return_value = StubClient(get_ret, post_ret)
+        return patched_get_client.return_value
+
+    clear_job_cache()
+    yield install
+    patched_get_client.return_value = shared_mock
+    clear_job_cache()
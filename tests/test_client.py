@@ -0,0 +1,164 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import patch
+
+import httpx
+
+from rundeck_mcp import client as client_module
+from rundeck_mcp.client import RundeckClient, get_client
+
+
+class TestGetClient(unittest.TestCase):
+    """Tests for the process-wide client accessor."""
+
+    def setUp(self):
+        """Reset the cached client between tests."""
+        patcher = patch.object(client_module, "_CLIENT", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch.object(client_module, "_TOKEN_CONFIGURED", new=True)
+    @patch.object(client_module, "API_TOKEN", "test-token")
+    def test_get_client_returns_singleton(self):
+        """Test get_client builds the client once and reuses it."""
+        first = get_client()
+        second = get_client()
+
+        self.assertIsInstance(first, RundeckClient)
+        self.assertIs(first, second)
+        first.close()
+
+    @patch.object(client_module, "_TOKEN_CONFIGURED", new=False)
+    def test_get_client_requires_token(self):
+        """Test get_client raises when no API token is configured."""
+        with self.assertRaises(ValueError) as context:
+            get_client()
+        self.assertIn("RUNDECK_API_TOKEN", str(context.exception))
+
+    def test_get_client_uses_context_factory(self):
+        """Test a client factory set in the context variable takes precedence."""
+        sentinel = object()
+        token = client_module.rundeck_client_factory.set(lambda *_args: sentinel)
+        self.addCleanup(client_module.rundeck_client_factory.reset, token)
+
+        self.assertIs(get_client(), sentinel)
+
+
+class TestRundeckClient(unittest.TestCase):
+    """Tests for RundeckClient request helpers."""
+
+    def test_identity_separates_credentials(self):
+        """Test clients of one server share an identity only when their tokens match."""
+        first = RundeckClient("token-a", "http://rundeck.local/")
+        same = RundeckClient("token-a", "http://rundeck.local")
+        other = RundeckClient("token-b", "http://rundeck.local")
+
+        self.assertEqual(first.identity, same.identity)
+        self.assertNotEqual(first.identity, other.identity)
+        self.assertNotIn("token-a", repr(first.identity))
+        for client in (first, same, other):
+            client.close()
+
+    def test_post_many_returns_results_in_order(self):
+        """Test post_many returns responses in request order, with failures in place."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/missing/run"):
+                return httpx.Response(404, json={"error": True})
+            return httpx.Response(200, json={"path": request.url.path, "body": json.loads(request.content)})
+
+        client = RundeckClient("test-token", "http://rundeck.local/")
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with patch.object(client, "async_client", return_value=mock_client):
+            results = asyncio.run(
+                client.post_many(
+                    [
+                        ("/job/first/run", {"options": {"env": "prod"}}),
+                        ("/job/missing/run", None),
+                        ("/job/second/run", None),
+                    ]
+                )
+            )
+        client.close()
+
+        self.assertEqual(results[0], {"path": "/api/44/job/first/run", "body": {"options": {"env": "prod"}}})
+        self.assertIsInstance(results[1], httpx.HTTPStatusError)
+        self.assertEqual(results[2], {"path": "/api/44/job/second/run", "body": {}})
+
+    def test_get_many_returns_results_in_order(self):
+        """Test get_many returns responses in request order, with failures in place."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/missing/executions"):
+                return httpx.Response(404, json={"error": True})
+            return httpx.Response(200, json={"path": request.url.path, "max": request.url.params.get("max")})
+
+        client = RundeckClient("test-token", "http://rundeck.local")
+        mock_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with patch.object(client, "async_client", return_value=mock_client):
+            results = asyncio.run(
+                client.get_many([("/job/first/executions", {"max": 5}), ("/job/missing/executions", None)])
+            )
+        client.close()
+
+        self.assertEqual(results[0], {"path": "/api/44/job/first/executions", "max": "5"})
+        self.assertIsInstance(results[1], httpx.HTTPStatusError)
+
+    def test_stream_json_yields_members(self):
+        """Test stream_json yields scalar members and streamed array elements."""
+        body = {
+            "id": 12345,
+            "completed": True,
+            "percentLoaded": 100.0,
+            "entries": [{"log": "one", "level": "NORMAL"}, {"log": "two", "level": "ERROR"}],
+            "nested": {"ignored": True},
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.assertEqual(request.url.params["maxlines"], "2")
+            return httpx.Response(200, json=body)
+
+        client = RundeckClient("test-token", "http://rundeck.local")
+        with patch.object(client, "_client", httpx.Client(transport=httpx.MockTransport(handler))):
+            members = list(client.stream_json("/execution/12345/output", params={"maxlines": 2}, items="entries"))
+        client.close()
+
+        self.assertEqual(
+            members,
+            [
+                ("id", 12345),
+                ("completed", True),
+                ("percentLoaded", 100.0),
+                ("entries", {"log": "one", "level": "NORMAL"}),
+                ("entries", {"log": "two", "level": "ERROR"}),
+            ],
+        )
+
+    def test_get_revalidates_with_etag(self):
+        """Test get sends If-None-Match and reuses the cached body on 304."""
+        seen_etags = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json={"id": "abc-123"}, headers={"ETag": '"v1"'})
+
+        client = RundeckClient("test-token", "http://rundeck.local")
+        with patch.object(client, "_client", httpx.Client(transport=httpx.MockTransport(handler))):
+            first = client.get("/job/abc-123")
+            second = client.get("/job/abc-123")
+            other = client.get("/job/abc-123", params={"format": "json"})
+        client.close()
+
+        self.assertEqual(first, {"id": "abc-123"})
+        self.assertEqual(second, first)
+        self.assertEqual(other, first)
+        self.assertEqual(seen_etags, [None, '"v1"', None])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,14 +1,36 @@
+import asyncio
+import copy
+import inspect
 import unittest
-from unittest.mock import MagicMock, patch
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pydantic import ValidationError
 
 from rundeck_mcp.models import (
+    LOG_ENTRIES_ADAPTER,
     Execution,
     ExecutionOutput,
     ExecutionQuery,
     ListResponseModel,
     LogEntry,
 )
-from rundeck_mcp.tools.executions import get_execution, get_execution_output, list_executions
+from rundeck_mcp.tools.executions import (
+    get_execution,
+    get_execution_output,
+    iter_execution_output,
+    list_executions,
+    list_executions_many,
+)
+
+
+def _stream_members(response):
+    """Mimic RundeckClient.stream_json output, which yields freshly decoded dicts per entry."""
+    for name, value in response.items():
+        if name == "entries":
+            yield from ((name, dict(entry)) for entry in value)
+        else:
+            yield name, value
 
 
 class TestExecutionModels(unittest.TestCase):
@@ -38,6 +60,24 @@ class TestExecutionModels(unittest.TestCase):
         self.assertEqual(params["max"], 50)
         self.assertEqual(params["offset"], 10)
 
+    def test_execution_query_to_params_drops_empty_filters(self):
+        """Test empty filters are not sent."""
+        query = ExecutionQuery(project="myproject", user="", recent_filter="", older_filter="")
+        self.assertEqual(query.to_params(), {"max": 20, "offset": 0})
+
+    def test_execution_query_to_params_time_range(self):
+        """Test ExecutionQuery converts begin/end to unix milliseconds."""
+        query = ExecutionQuery(
+            job_id="abc-123",
+            begin=datetime(2023, 11, 14, 22, 13, 20, tzinfo=UTC),
+            end=datetime(2023, 11, 14, 22, 14, 5, tzinfo=UTC),
+        )
+        params = query.to_params()
+        self.assertEqual(params["begin"], 1700000000000)
+        self.assertEqual(params["end"], 1700000045000)
+        self.assertNotIn("job_id", params)
+        self.assertEqual(hash(query), hash(query.model_copy()))
+
     def test_execution_date_parsing_dict(self):
         """Test Execution parses date from dict format."""
         data = {
@@ -52,6 +92,20 @@ class TestExecutionModels(unittest.TestCase):
         self.assertIsNotNone(execution.date_started)
         self.assertIsNotNone(execution.date_ended)
 
+    def test_execution_date_parsing_utc(self):
+        """Test unixtime and ISO dates parse to the same UTC datetime."""
+        data = {
+            "id": 123,
+            "status": "succeeded",
+            "project": "myproject",
+            "user": "admin",
+            "date-started": {"unixtime": 1700000000000},
+            "date-ended": "2023-11-14T22:13:20Z",
+        }
+        execution = Execution.model_validate(data)
+        self.assertEqual(execution.date_started, datetime(2023, 11, 14, 22, 13, 20, tzinfo=UTC))
+        self.assertEqual(execution.date_started, execution.date_ended)
+
     def test_execution_duration_seconds(self):
         """Test Execution.duration_seconds computed field."""
         execution = Execution(
@@ -74,7 +128,7 @@ class TestExecutionModels(unittest.TestCase):
         self.assertAlmostEqual(execution.duration_seconds, 45.0, places=0)
 
     def test_execution_summary(self):
-        """Test Execution.execution_summary computed field."""
+        """Test Execution.execution_summary property."""
         execution = Execution(
             id=123,
             status="succeeded",
@@ -98,6 +152,13 @@ class TestExecutionModels(unittest.TestCase):
         )
         self.assertEqual(entry.level, "ERROR")
         self.assertEqual(entry.log, "Something went wrong")
+        self.assertEqual(entry.step, "1")
+
+    def test_log_entry_levels_interned(self):
+        """Test known log levels share one string object across entries."""
+        levels = ["".join(["ERR", "OR"]), "".join(["ERR", "OR"])]
+        first, second = LOG_ENTRIES_ADAPTER.validate_python([{"level": level} for level in levels])
+        self.assertIs(first.level, second.level)
 
     def test_execution_output_summary(self):
         """Test ExecutionOutput.output_summary computed field."""
@@ -119,7 +180,12 @@ class TestExecutionTools(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls):
-        """Set up test fixtures."""
+        """Set up test fixtures and patch get_client once for the whole class."""
+        cls.mock_client = MagicMock()
+        patcher = patch("rundeck_mcp.tools.executions.get_client", return_value=cls.mock_client)
+        patcher.start()
+        cls.addClassCleanup(patcher.stop)
+
         cls.sample_execution_data = {
             "id": 12345,
             "href": "/api/44/execution/12345",
@@ -172,55 +238,92 @@ class TestExecutionTools(unittest.TestCase):
             ],
         }
 
-    @patch("rundeck_mcp.tools.executions.get_client")
-    def test_list_executions_by_project(self, mock_get_client):
+    def setUp(self):
+        """Clear calls left by the previous test and give this test its own copy of the fixtures.
+
+        The mocked client returns plain dicts, as decoded JSON is, so a test that
+        mutates a response cannot change what later tests see.
+        """
+        self.mock_client.reset_mock(return_value=True, side_effect=True)
+        self.sample_execution_data = copy.deepcopy(self.sample_execution_data)
+        self.sample_executions_response = copy.deepcopy(self.sample_executions_response)
+        self.sample_output_response = copy.deepcopy(self.sample_output_response)
+
+    def test_list_executions_by_project(self):
         """Test list_executions filters by project."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_executions_response
-        mock_get_client.return_value = mock_client
+        self.mock_client.get.return_value = self.sample_executions_response
 
         query = ExecutionQuery(project="myproject")
         result = list_executions(query)
 
         self.assertIsInstance(result, ListResponseModel)
         self.assertEqual(len(result.response), 2)
-        mock_client.get.assert_called_with(
+        self.assertIn("2 record(s) of type 'Execution'", result.response_summary)
+        self.mock_client.get.assert_called_with(
             "/project/myproject/executions",
             params={"max": 20, "offset": 0},
         )
 
-    @patch("rundeck_mcp.tools.executions.get_client")
-    def test_list_executions_by_job(self, mock_get_client):
+    def test_list_executions_by_job(self):
         """Test list_executions filters by job_id."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_executions_response
-        mock_get_client.return_value = mock_client
+        self.mock_client.get.return_value = self.sample_executions_response
 
         query = ExecutionQuery(job_id="abc-123")
         list_executions(query)
 
-        mock_client.get.assert_called_with(
+        self.mock_client.get.assert_called_with(
             "/job/abc-123/executions",
             params={"max": 20, "offset": 0},
         )
 
-    @patch("rundeck_mcp.tools.executions.get_client")
-    def test_list_executions_requires_filter(self, mock_get_client):
-        """Test list_executions requires project or job_id."""
-        mock_client = MagicMock()
-        mock_get_client.return_value = mock_client
+    def test_list_executions_shares_job_references(self):
+        """Test executions of the same job share one JobReference instance."""
+        self.mock_client.get.return_value = [self.sample_execution_data, {**self.sample_execution_data, "id": 12346}]
 
+        result = list_executions(ExecutionQuery(job_id="abc-123"))
+
+        self.assertEqual(result.response[0].job.name, "Deploy")
+        self.assertIs(result.response[0].job, result.response[1].job)
+
+    def test_list_executions_rejects_malformed_record(self):
+        """Test an unknown status or mistyped field fails at parsing instead of reaching the formatters."""
+        for malformed in ({"status": "failed-with-retry"}, {"id": "not-a-number"}):
+            with self.subTest(malformed=malformed):
+                self.mock_client.get.return_value = [{**self.sample_execution_data, **malformed}]
+                with self.assertRaises(ValidationError):
+                    list_executions(ExecutionQuery(job_id="abc-123"))
+
+    def test_list_executions_requires_filter(self):
+        """Test list_executions requires project or job_id."""
         query = ExecutionQuery()
         with self.assertRaises(ValueError) as context:
             list_executions(query)
         self.assertIn("Either project or job_id must be provided", str(context.exception))
 
-    @patch("rundeck_mcp.tools.executions.get_client")
-    def test_get_execution(self, mock_get_client):
+    def test_list_executions_many(self):
+        """Test list_executions_many fetches every query in one batch, in order."""
+        self.mock_client.get_many = AsyncMock(
+            return_value=[self.sample_executions_response, [self.sample_execution_data]],
+        )
+
+        results = asyncio.run(
+            list_executions_many(
+                [ExecutionQuery(project="myproject"), ExecutionQuery(job_id="abc-123", status="succeeded")],
+            )
+        )
+
+        self.assertEqual([len(result.response) for result in results], [2, 1])
+        self.assertEqual(results[1].response[0].job.name, "Deploy")
+        self.mock_client.get_many.assert_awaited_once_with(
+            [
+                ("/project/myproject/executions", {"max": 20, "offset": 0}),
+                ("/job/abc-123/executions", {"statusFilter": "succeeded", "max": 20, "offset": 0}),
+            ]
+        )
+
+    def test_get_execution(self):
         """Test get_execution returns full execution details."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_execution_data
-        mock_get_client.return_value = mock_client
+        self.mock_client.get.return_value = self.sample_execution_data
 
         result = get_execution(12345)
 
@@ -230,12 +333,9 @@ class TestExecutionTools(unittest.TestCase):
         self.assertIsNotNone(result.job)
         self.assertEqual(result.job.name, "Deploy")
 
-    @patch("rundeck_mcp.tools.executions.get_client")
-    def test_get_execution_output(self, mock_get_client):
+    def test_get_execution_output(self):
         """Test get_execution_output returns logs."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_output_response
-        mock_get_client.return_value = mock_client
+        self.mock_client.stream_json.return_value = _stream_members(self.sample_output_response)
 
         result = get_execution_output(12345)
 
@@ -245,20 +345,55 @@ class TestExecutionTools(unittest.TestCase):
         self.assertEqual(len(result.entries), 2)
         self.assertEqual(result.entries[0].log, "Starting deployment...")
 
-    @patch("rundeck_mcp.tools.executions.get_client")
-    def test_get_execution_output_with_params(self, mock_get_client):
+    def test_get_execution_output_with_params(self):
         """Test get_execution_output with optional parameters."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_output_response
-        mock_get_client.return_value = mock_client
+        self.mock_client.stream_json.return_value = _stream_members(self.sample_output_response)
 
         get_execution_output(12345, last_lines=50, node="server1")
 
-        mock_client.get.assert_called_with(
+        self.mock_client.stream_json.assert_called_with(
             "/execution/12345/output/node/server1",
             params={"lastlines": 50},
+            items="entries",
         )
 
+    def test_get_execution_output_caps_entries(self):
+        """Test get_execution_output keeps at most max_lines entries."""
+        self.mock_client.stream_json.return_value = _stream_members(self.sample_output_response)
+
+        result = get_execution_output(12345, max_lines=1)
+
+        self.assertEqual(len(result.entries), 1)
+        self.assertEqual(result.offset, 1024)
+
+    def test_iter_execution_output(self):
+        """Test iter_execution_output yields LogEntry objects, stops at max_lines and closes the stream."""
+        stream = _stream_members(self.sample_output_response)
+        self.mock_client.stream_json.return_value = stream
+
+        entries = list(iter_execution_output(12345, max_lines=1, node="server1"))
+
+        self.assertEqual(inspect.getgeneratorstate(stream), inspect.GEN_CLOSED)
+        self.assertEqual(len(entries), 1)
+        self.assertIsInstance(entries[0], LogEntry)
+        self.assertEqual(entries[0].log, "Starting deployment...")
+        self.mock_client.stream_json.assert_called_once_with(
+            "/execution/12345/output/node/server1",
+            params={"maxlines": 1},
+            items="entries",
+        )
+
+    def test_iter_execution_output_abandoned(self):
+        """Test closing iter_execution_output early also closes the underlying stream."""
+        stream = _stream_members(self.sample_output_response)
+        self.mock_client.stream_json.return_value = stream
+
+        entries = iter_execution_output(12345)
+        next(entries)
+        entries.close()
+
+        self.assertEqual(inspect.getgeneratorstate(stream), inspect.GEN_CLOSED)
+
 
 if __name__ == "__main__":
     unittest.main()
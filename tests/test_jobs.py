@@ -1,9 +1,85 @@
+import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from unittest.mock import AsyncMock
+
+import httpx
+import pytest
+
+from rundeck_mcp.models import BatchJobRunRequest, Job, JobOption, JobQuery, JobRunRequest
+from rundeck_mcp.tools.jobs import (
+    clear_job_cache,
+    get_job,
+    get_jobs_bulk,
+    list_jobs,
+    run_job,
+    run_job_by_index,
+    run_jobs,
+)
+from rundeck_mcp.utils import enforced_value_sets, format_job_options_for_display, validate_job_options
+
+# Shared, read-only API fixtures: no test may mutate what another test sees
+SAMPLE_JOB_DATA = MappingProxyType(
+    {
+        "id": "abc-123-def",
+        "name": "Deploy Application",
+        "group": "deploy/prod",
+        "project": "myproject",
+        "description": "Deploy the application to production",
+        "href": "/api/44/job/abc-123-def",
+        "permalink": "/project/myproject/job/show/abc-123-def",
+        "scheduled": True,
+        "scheduleEnabled": True,
+        "enabled": True,
+        "averageDuration": 45000,
+        "options": (
+            MappingProxyType(
+                {
+                    "name": "version",
+                    "required": True,
+                    "description": "Version to deploy",
+                }
+            ),
+            MappingProxyType(
+                {
+                    "name": "env",
+                    "value": "staging",
+                    "values": ("dev", "staging", "prod"),
+                    "enforced": True,
+                }
+            ),
+        ),
+    }
+)
+
+SAMPLE_JOBS_LIST = (
+    MappingProxyType(
+        {
+            "id": "abc-123",
+            "name": "Job 1",
+            "project": "myproject",
+        }
+    ),
+    MappingProxyType(
+        {
+            "id": "def-456",
+            "name": "Job 2",
+            "project": "myproject",
+        }
+    ),
+)
+
+# Tool inputs shared by the tests below; the tools only read them
+MYPROJECT_QUERY = JobQuery(project="myproject")
+SECOND_PAGE_QUERY = JobQuery(project="myproject", limit=2, offset=10)
+VERSION_ONLY_REQUEST = JobRunRequest(options={"version": "1.0"})
+MISSING_VERSION_REQUEST = JobRunRequest(options={"env": "prod"})
+INVALID_ENV_REQUEST = JobRunRequest(options={"version": "1.0", "env": "invalid"})
+VALID_REQUEST = JobRunRequest(options={"version": "1.0", "env": "prod"})
 
-from rundeck_mcp.models import Job, JobOption, JobQuery, JobRunRequest
-from rundeck_mcp.tools.jobs import get_job, list_jobs, run_job
-from rundeck_mcp.utils import format_job_options_for_display, validate_job_options
+# What the tools send for the inputs above, serialized once
+MYPROJECT_PARAMS = MYPROJECT_QUERY.to_params()
+VALID_RUN_BODY = VALID_REQUEST.to_request_body()
 
 
 class TestJobModels(unittest.TestCase):
@@ -11,9 +87,7 @@ class TestJobModels(unittest.TestCase):
 
     def test_job_query_to_params_minimal(self):
         """Test JobQuery with only required fields."""
-        query = JobQuery(project="myproject")
-        params = query.to_params()
-        self.assertEqual(params, {"max": 1000})
+        self.assertEqual(MYPROJECT_PARAMS, {"max": 50, "offset": 0})
 
     def test_job_query_to_params_full(self):
         """Test JobQuery with all fields populated."""
@@ -23,49 +97,29 @@ class TestJobModels(unittest.TestCase):
             job_filter="backup",
             scheduled_filter=True,
             tags="critical,daily",
-            limit=50,
+            limit=25,
+            offset=50,
         )
         params = query.to_params()
         self.assertEqual(params["groupPath"], "deploy/prod")
         self.assertEqual(params["jobFilter"], "backup")
         self.assertEqual(params["scheduledFilter"], True)
         self.assertEqual(params["tags"], "critical,daily")
-        self.assertEqual(params["max"], 50)
-
-    def test_job_option_summary_required(self):
-        """Test JobOption summary for required option."""
-        opt = JobOption(
-            name="version",
-            required=True,
-            description="Version to deploy",
-        )
-        summary = opt.option_summary
-        self.assertIn("'version'", summary)
-        self.assertIn("[REQUIRED]", summary)
-        self.assertIn("Version to deploy", summary)
-
-    def test_job_option_summary_with_default(self):
-        """Test JobOption summary with default value."""
-        opt = JobOption(
-            name="env",
-            value="staging",
-            description="Target environment",
-        )
-        summary = opt.option_summary
-        self.assertIn("(default: 'staging')", summary)
-
-    def test_job_option_summary_with_values(self):
-        """Test JobOption summary with allowed values."""
-        opt = JobOption(
-            name="env",
-            values=["dev", "staging", "prod"],
-        )
-        summary = opt.option_summary
-        self.assertIn("[allowed:", summary)
-        self.assertIn("dev", summary)
+        self.assertEqual(params["max"], 25)
+        self.assertEqual(params["offset"], 50)
+
+    def test_job_query_to_params_drops_empty_filters(self):
+        """Test empty filters are not sent, while an empty group path still selects the root level."""
+        query = JobQuery(project="myproject", group_path="", job_filter="", job_exact_filter="", tags="")
+        self.assertEqual(query.to_params(), {"groupPath": "", "max": 50, "offset": 0})
+
+    def test_job_run_request_drops_empty_values(self):
+        """Test empty options and strings are left out of the run request body."""
+        request = JobRunRequest(options={}, as_user="", node_filter="")
+        self.assertEqual(request.to_request_body(), {})
 
     def test_job_required_options(self):
-        """Test Job.required_options computed field."""
+        """Test Job.required_options property."""
         job = Job(
             id="abc-123",
             name="Deploy",
@@ -78,6 +132,36 @@ class TestJobModels(unittest.TestCase):
         )
         self.assertEqual(job.required_options, ["version", "replicas"])
 
+    def test_job_options_summary(self):
+        """Test Job.options_summary lists every option."""
+        job = Job(
+            id="abc-123",
+            name="Deploy",
+            options=[
+                JobOption(name="version", required=True),
+                JobOption(name="env", value="staging"),
+            ],
+        )
+        self.assertEqual(job.options_summary, "Job Options:\n  - 'version' [REQUIRED]\n  - 'env' (default: 'staging')")
+        self.assertIsNone(Job(id="abc-123", name="Deploy").options_summary)
+
+    def test_job_model_validate_api_aliases(self):
+        """Test Job parses Rundeck's camelCase API fields, including nested options."""
+        job = Job.model_validate(
+            {
+                "id": "abc-123",
+                "name": "Deploy",
+                "scheduleEnabled": False,
+                "averageDuration": 45000,
+                "options": [{"name": "password", "secure": True, "storagePath": "keys/db", "type": "text"}],
+                "uuid": "ignored",
+            }
+        )
+        self.assertFalse(job.schedule_enabled)
+        self.assertEqual(job.average_duration, 45000)
+        self.assertEqual(job.options[0].storage_path, "keys/db")
+        self.assertEqual(job.options[0].option_type, "text")
+
     def test_job_run_request_to_body(self):
         """Test JobRunRequest conversion to request body."""
         request = JobRunRequest(
@@ -89,230 +173,290 @@ class TestJobModels(unittest.TestCase):
         self.assertEqual(body["loglevel"], "DEBUG")
 
 
-class TestValidateJobOptions(unittest.TestCase):
-    """Tests for job option validation logic."""
+@pytest.mark.parametrize(
+    ("fields", "needles"),
+    [
+        pytest.param(
+            {"name": "version", "required": True, "description": "Version to deploy"},
+            ["'version'", "[REQUIRED]", "Version to deploy"],
+            id="required",
+        ),
+        pytest.param(
+            {"name": "env", "value": "staging", "description": "Target environment"},
+            ["(default: 'staging')"],
+            id="with_default",
+        ),
+        pytest.param({"name": "env", "values": ["dev", "staging", "prod"]}, ["[allowed:", "dev"], id="with_values"),
+    ],
+)
+def test_job_option_summary(fields, needles):
+    """Test JobOption summary shows the required marker, default and allowed values."""
+    summary = JobOption(**fields).option_summary
+    for needle in needles:
+        assert needle in summary
+
+
+# Option definitions shared by the validation and display tests of rundeck_mcp.utils
+REQUIRED_VERSION_OPTION = MappingProxyType({"name": "version", "required": True})
+DEFAULT_ENV_OPTION = MappingProxyType({"name": "env", "value": "staging"})
+ENFORCED_ENV_OPTION = MappingProxyType({"name": "env", "enforced": True, "values": ["dev", "staging", "prod"]})
+
+
+@pytest.mark.parametrize(
+    ("job_options", "provided", "valid", "error"),
+    [
+        pytest.param(None, None, True, None, id="no_options_required"),
+        pytest.param(None, {"foo": "bar"}, False, "Job has no options", id="provided_when_none_expected"),
+        pytest.param(
+            [REQUIRED_VERSION_OPTION, DEFAULT_ENV_OPTION],
+            {},
+            False,
+            "Required option 'version' is missing",
+            id="missing_required",
+        ),
+        pytest.param(
+            [{"name": "version", "required": True, "value": "1.0.0"}], {}, True, None, id="required_with_default"
+        ),
+        pytest.param(
+            [ENFORCED_ENV_OPTION],
+            {"env": "invalid"},
+            False,
+            "not in allowed values",
+            id="enforced_values",
+        ),
+        pytest.param(
+            [ENFORCED_ENV_OPTION],
+            {"env": "prod"},
+            True,
+            None,
+            id="enforced_values_valid",
+        ),
+        pytest.param(
+            [{"name": "version"}],
+            {"version": "1.0", "unknown": "value"},
+            False,
+            "Unknown options",
+            id="unknown_options",
+        ),
+    ],
+)
+def test_validate_job_options(job_options, provided, valid, error):
+    """Test option validation accepts valid input and reports the first problem otherwise."""
+    is_valid, errors = validate_job_options(job_options, provided)
+    assert is_valid is valid
+    if error is None:
+        assert errors == []
+    else:
+        assert error in errors[0]
+
+
+def test_validate_enforced_values_precomputed():
+    """Test validation uses precomputed enforced value sets."""
+    job_options = [ENFORCED_ENV_OPTION, {"name": "version", "values": ["1.0", "2.0"]}]
+    enforced_sets = enforced_value_sets(job_options)
+    assert enforced_sets == {"env": frozenset({"dev", "staging", "prod"})}
+
+    is_valid, errors = validate_job_options(job_options, {"env": "qa"}, enforced_sets=enforced_sets)
+    assert not is_valid
+    assert errors == ["Option 'env' value 'qa' is not in allowed values: ['dev', 'staging', 'prod']"]
+
+
+def test_format_no_options():
+    """Test formatting when job has no options."""
+    assert format_job_options_for_display(None) == "This job has no options."
+
+
+@pytest.mark.parametrize(
+    ("options", "needles"),
+    [
+        pytest.param([REQUIRED_VERSION_OPTION], ["[REQUIRED]"], id="required_option"),
+        pytest.param([DEFAULT_ENV_OPTION], ["(default: 'staging')"], id="default_value"),
+        pytest.param([ENFORCED_ENV_OPTION], ["must be", "'dev'"], id="allowed_values_enforced"),
+        pytest.param(
+            [{"name": "env", "enforced": False, "values": ["dev", "prod"]}],
+            ["suggested"],
+            id="allowed_values_suggested",
+        ),
+    ],
+)
+def test_format_job_options(options, needles):
+    """Test options display shows required markers, defaults and allowed values."""
+    result = format_job_options_for_display(options)
+    for needle in needles:
+        assert needle in result
+
+
+def test_list_jobs(stub_client):
+    """Test list_jobs returns markdown table."""
+    client = stub_client(get_ret=SAMPLE_JOBS_LIST)
+
+    result = list_jobs(MYPROJECT_QUERY)
+
+    assert "| # | Name | Group | Job ID |" in result
+    assert "| 1 | Job 1 |" in result
+    assert "| 2 | Job 2 |" in result
+    assert client.get_calls == [("/project/myproject/jobs", MYPROJECT_PARAMS)]
+
+
+def test_list_jobs_max_render(stub_client):
+    """Test list_jobs caps the table rows and reports the hidden jobs."""
+    stub_client(get_ret=SAMPLE_JOBS_LIST)
+
+    result = list_jobs(MYPROJECT_QUERY, max_render=1)
+
+    assert "**2 jobs found.**" in result
+    assert "| 1 | Job 1 |" in result
+    assert "Job 2" not in result
+    assert "+ 1 more jobs not shown" in result
+
+
+@pytest.mark.parametrize("max_render", [0, -2])
+def test_list_jobs_rejects_max_render_below_one(stub_client, max_render):
+    """Test list_jobs refuses a max_render that would hide rows without showing any or drop the last ones."""
+    client = stub_client(get_ret=SAMPLE_JOBS_LIST)
+
+    with pytest.raises(ValueError, match="max_render must be at least 1"):
+        list_jobs(MYPROJECT_QUERY, max_render=max_render)
+    assert client.get_calls == []
 
-    def test_validate_no_options_required(self):
-        """Test validation when job has no options."""
-        is_valid, errors = validate_job_options(None, None)
-        self.assertTrue(is_valid)
-        self.assertEqual(errors, [])
 
-    def test_validate_provided_when_none_expected(self):
-        """Test validation fails when options provided but none expected."""
-        is_valid, errors = validate_job_options(None, {"foo": "bar"})
-        self.assertFalse(is_valid)
-        self.assertIn("Job has no options", errors[0])
+def test_list_jobs_max_render_below_limit(stub_client):
+    """Test the next page starts after the last shown job when max_render hides part of a page."""
+    stub_client(get_ret=[{"id": f"job-{idx}", "name": f"Job {idx}"} for idx in range(1, 11)])
 
-    def test_validate_missing_required(self):
-        """Test validation fails when required option is missing."""
-        job_options = [
-            {"name": "version", "required": True},
-            {"name": "env", "required": False, "value": "staging"},
-        ]
-        is_valid, errors = validate_job_options(job_options, {})
-        self.assertFalse(is_valid)
-        self.assertIn("Required option 'version' is missing", errors[0])
-
-    def test_validate_required_with_default(self):
-        """Test required option with default passes without value."""
-        job_options = [
-            {"name": "version", "required": True, "value": "1.0.0"},
-        ]
-        is_valid, errors = validate_job_options(job_options, {})
-        self.assertTrue(is_valid)
+    result = list_jobs(JobQuery(project="myproject", limit=10), max_render=3)
 
-    def test_validate_enforced_values(self):
-        """Test validation fails for invalid enforced values."""
-        job_options = [
-            {"name": "env", "enforced": True, "values": ["dev", "staging", "prod"]},
-        ]
-        is_valid, errors = validate_job_options(job_options, {"env": "invalid"})
-        self.assertFalse(is_valid)
-        self.assertIn("not in allowed values", errors[0])
-
-    def test_validate_enforced_values_valid(self):
-        """Test validation passes for valid enforced values."""
-        job_options = [
-            {"name": "env", "enforced": True, "values": ["dev", "staging", "prod"]},
-        ]
-        is_valid, errors = validate_job_options(job_options, {"env": "prod"})
-        self.assertTrue(is_valid)
+    assert "| 3 | Job 3 |" in result
+    assert "Job 4" not in result
+    assert "+ 7 more jobs not shown" in result
+    assert "offset=3 " in result
 
-    def test_validate_unknown_options(self):
-        """Test validation warns about unknown options."""
-        job_options = [
-            {"name": "version"},
-        ]
-        is_valid, errors = validate_job_options(job_options, {"version": "1.0", "unknown": "value"})
-        self.assertFalse(is_valid)
-        self.assertIn("Unknown options", errors[0])
-
-
-class TestFormatJobOptions(unittest.TestCase):
-    """Tests for job options display formatting."""
-
-    def test_format_no_options(self):
-        """Test formatting when job has no options."""
-        result = format_job_options_for_display(None)
-        self.assertEqual(result, "This job has no options.")
-
-    def test_format_required_option(self):
-        """Test formatting shows required marker."""
-        options = [{"name": "version", "required": True}]
-        result = format_job_options_for_display(options)
-        self.assertIn("[REQUIRED]", result)
-
-    def test_format_default_value(self):
-        """Test formatting shows default value."""
-        options = [{"name": "env", "value": "staging"}]
-        result = format_job_options_for_display(options)
-        self.assertIn("(default: 'staging')", result)
-
-    def test_format_allowed_values_enforced(self):
-        """Test formatting shows enforced allowed values."""
-        options = [{"name": "env", "enforced": True, "values": ["dev", "prod"]}]
-        result = format_job_options_for_display(options)
-        self.assertIn("must be", result)
-        self.assertIn("'dev'", result)
-
-    def test_format_allowed_values_suggested(self):
-        """Test formatting shows suggested allowed values."""
-        options = [{"name": "env", "enforced": False, "values": ["dev", "prod"]}]
-        result = format_job_options_for_display(options)
-        self.assertIn("suggested", result)
-
-
-class TestJobTools(unittest.TestCase):
-    """Tests for job tool functions."""
-
-    @classmethod
-    def setUpClass(cls):
-        """Set up test fixtures."""
-        cls.sample_job_data = {
-            "id": "abc-123-def",
-            "name": "Deploy Application",
-            "group": "deploy/prod",
-            "project": "myproject",
-            "description": "Deploy the application to production",
-            "href": "/api/44/job/abc-123-def",
-            "permalink": "/project/myproject/job/show/abc-123-def",
-            "scheduled": True,
-            "scheduleEnabled": True,
-            "enabled": True,
-            "averageDuration": 45000,
-            "options": [
-                {
-                    "name": "version",
-                    "required": True,
-                    "description": "Version to deploy",
-                },
-                {
-                    "name": "env",
-                    "value": "staging",
-                    "values": ["dev", "staging", "prod"],
-                    "enforced": True,
-                },
-            ],
-        }
 
-        cls.sample_jobs_list = [
-            {
-                "id": "abc-123",
-                "name": "Job 1",
-                "project": "myproject",
-            },
-            {
-                "id": "def-456",
-                "name": "Job 2",
-                "project": "myproject",
-            },
-        ]
+def test_list_jobs_next_page(stub_client):
+    """Test list_jobs continues numbering and points to the next page on a full page."""
+    client = stub_client(get_ret=SAMPLE_JOBS_LIST)
+
+    result = list_jobs(SECOND_PAGE_QUERY)
+
+    assert "| 11 | Job 1 |" in result
+    assert "| 12 | Job 2 |" in result
+    assert "offset=12" in result
+    assert client.get_calls == [("/project/myproject/jobs", {"max": 2, "offset": 10})]
+
+
+def test_get_job(stub_client):
+    """Test get_job returns formatted job details with options table."""
+    stub_client(get_ret=SAMPLE_JOB_DATA)
+
+    result = get_job("abc-123-def")
+
+    needles = (
+        "## Deploy Application",
+        "abc-123-def",
+        "### Job Options",
+        "| # | Option | Required | Default | Allowed Values |",
+        "**version**",
+        "🔴 Yes",  # Required marker
+    )
+    missing = [needle for needle in needles if needle not in result]
+    assert not missing, f"missing: {missing}"
+
+
+def test_get_jobs_bulk(mock_client):
+    """Test get_jobs_bulk fetches all jobs in one batch and formats each, in order."""
+    mock_client.get_many = AsyncMock(return_value=[[SAMPLE_JOB_DATA], SAMPLE_JOBS_LIST[1]])
+
+    result = asyncio.run(get_jobs_bulk(["abc-123-def", "def-456"]))
+
+    assert result.index("## Deploy Application") < result.index("## Job 2")
+    assert "`version`" in result
+    mock_client.get_many.assert_awaited_once_with([("/job/abc-123-def", None), ("/job/def-456", None)])
+
+
+def test_get_job_caps_options_table(stub_client):
+    """Test get_job lists at most 50 options and notes the rest."""
+    stub_client(get_ret={**SAMPLE_JOB_DATA, "options": [{"name": f"opt{idx}"} for idx in range(1, 53)]})
+
+    result = get_job("abc-123-def")
+
+    assert "| 50 | **opt50** |" in result
+    assert "opt51" not in result
+    assert "...and 2 more options not shown." in result
+
+
+def test_job_tools_share_cache(mock_client):
+    """Test get_job, get_jobs_bulk and run_job reuse each other's fetched definitions."""
+    mock_client.get.side_effect = [SAMPLE_JOB_DATA]
+    mock_client.get_many = AsyncMock(return_value=[SAMPLE_JOBS_LIST[0]])
+
+    get_job("abc-123-def")
+    asyncio.run(get_jobs_bulk(["abc-123-def", "abc-123"]))
+    asyncio.run(get_jobs_bulk(["abc-123"]))
+    run_job("abc-123-def", VERSION_ONLY_REQUEST)
+
+    mock_client.get.assert_called_once_with("/job/abc-123-def")
+    mock_client.get_many.assert_awaited_once_with([("/job/abc-123", None)])
+
+
+def test_job_cache_keeps_credentials_apart(stub_client):
+    """Test a job cached for one API token is fetched again, under its own ACL, for another token."""
+    first = stub_client(get_ret=SAMPLE_JOB_DATA)
+    get_job("abc-123-def")
+    other_tenant = stub_client(get_ret=SAMPLE_JOB_DATA)
+    other_tenant.token = "other-token"
 
-    @patch("rundeck_mcp.tools.jobs.get_client")
-    def test_list_jobs(self, mock_get_client):
-        """Test list_jobs returns markdown table."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_jobs_list
-        mock_get_client.return_value = mock_client
-
-        query = JobQuery(project="myproject")
-        result = list_jobs(query)
-
-        self.assertIsInstance(result, str)
-        self.assertIn("| # | Name | Group | Job ID |", result)
-        self.assertIn("| 1 | Job 1 |", result)
-        self.assertIn("| 2 | Job 2 |", result)
-
-    @patch("rundeck_mcp.tools.jobs.get_client")
-    def test_get_job(self, mock_get_client):
-        """Test get_job returns formatted job details with options table."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_job_data
-        mock_get_client.return_value = mock_client
-
-        result = get_job("abc-123-def")
-
-        self.assertIsInstance(result, str)
-        self.assertIn("## Deploy Application", result)
-        self.assertIn("abc-123-def", result)
-        self.assertIn("### Job Options", result)
-        self.assertIn("| # | Option | Required | Default | Allowed Values |", result)
-        self.assertIn("**version**", result)
-        self.assertIn("🔴 Yes", result)  # Required marker
-
-    @patch("rundeck_mcp.tools.jobs.get_client")
-    def test_run_job_validates_options(self, mock_get_client):
-        """Test run_job returns formatted error for missing required options."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_job_data
-        mock_get_client.return_value = mock_client
-
-        # Missing required 'version' option
-        result = run_job("abc-123-def", JobRunRequest(options={"env": "prod"}))
-
-        self.assertIsInstance(result, str)
-        self.assertIn("❌ Cannot run", result)
-        self.assertIn("Required option 'version' is missing", result)
-        self.assertIn("| Option | Required | Default | Allowed Values | Your Value |", result)
-        self.assertIn("**version**", result)
-
-    @patch("rundeck_mcp.tools.jobs.get_client")
-    def test_run_job_validates_enforced_values(self, mock_get_client):
-        """Test run_job returns formatted error for invalid enforced values."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_job_data
-        mock_get_client.return_value = mock_client
-
-        # Invalid value for enforced 'env' option
-        result = run_job("abc-123-def", JobRunRequest(options={"version": "1.0", "env": "invalid"}))
-
-        self.assertIsInstance(result, str)
-        self.assertIn("❌ Cannot run", result)
-        self.assertIn("not in allowed values", result)
-
-    @patch("rundeck_mcp.tools.jobs.get_client")
-    def test_run_job_preview(self, mock_get_client):
-        """Test run_job shows preview without confirmed=True."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_job_data
-        mock_get_client.return_value = mock_client
-
-        result = run_job("abc-123-def", JobRunRequest(options={"version": "1.0", "env": "prod"}))
-
-        self.assertIsInstance(result, str)
-        self.assertIn("🚀 Ready to run", result)
-        self.assertIn("Options to be used", result)
-        self.assertIn("| Option | Value |", result)
-        self.assertIn("confirmed=True", result)
-        mock_client.post.assert_not_called()  # Should NOT execute yet
-
-    @patch("rundeck_mcp.tools.jobs.get_client")
-    def test_run_job_success(self, mock_get_client):
-        """Test run_job executes successfully with confirmed=True."""
-        mock_client = MagicMock()
-        mock_client.get.return_value = self.sample_job_data
-        mock_client.post.return_value = {
+    get_job("abc-123-def")
+
+    assert first.get_calls == [("/job/abc-123-def", None)]
+    assert other_tenant.get_calls == [("/job/abc-123-def", None)]
+
+
+def test_run_job_validates_options(stub_client):
+    """Test run_job returns formatted error for missing required options."""
+    stub_client(get_ret=SAMPLE_JOB_DATA)
+
+    # Missing required 'version' option
+    result = run_job("abc-123-def", MISSING_VERSION_REQUEST)
+
+    needles = (
+        "❌ Cannot run",
+        "Required option 'version' is missing",
+        "| Option | Required | Default | Allowed Values | Your Value |",
+        "**version**",
+    )
+    missing = [needle for needle in needles if needle not in result]
+    assert not missing, f"missing: {missing}"
+
+
+def test_run_job_validates_enforced_values(stub_client):
+    """Test run_job returns formatted error for invalid enforced values."""
+    stub_client(get_ret=SAMPLE_JOB_DATA)
+
+    # Invalid value for enforced 'env' option
+    result = run_job("abc-123-def", INVALID_ENV_REQUEST)
+
+    assert "❌ Cannot run" in result
+    assert "not in allowed values" in result
+
+
+def test_run_job_preview(stub_client):
+    """Test run_job shows preview without confirmed=True."""
+    client = stub_client(get_ret=SAMPLE_JOB_DATA)
+
+    result = run_job("abc-123-def", VALID_REQUEST)
+
+    assert "🚀 Ready to run" in result
+    assert "Options to be used" in result
+    assert "| Option | Value |" in result
+    assert "confirmed=True" in result
+    assert client.post_calls == []  # Should NOT execute yet
+
+
+def test_run_job_success(stub_client):
+    """Test run_job executes successfully with confirmed=True."""
+    client = stub_client(
+        get_ret=SAMPLE_JOB_DATA,
+        post_ret={
             "id": 12345,
             "href": "/api/44/execution/12345",
             "permalink": "/project/myproject/execution/show/12345",
@@ -324,18 +468,188 @@ class TestJobTools(unittest.TestCase):
                 "name": "Deploy Application",
                 "project": "myproject",
             },
-        }
-        mock_get_client.return_value = mock_client
-
-        result = run_job("abc-123-def", JobRunRequest(options={"version": "1.0", "env": "prod"}), confirmed=True)
-
-        self.assertIsInstance(result, str)
-        self.assertIn("✅ Job Started", result)
-        self.assertIn("Deploy Application", result)
-        self.assertIn("12345", result)
-        self.assertIn("running", result)
-        mock_client.post.assert_called_once()
-
-
-if __name__ == "__main__":
-    unittest.main()
+        },
+    )
+
+    result = run_job("abc-123-def", VALID_REQUEST, confirmed=True)
+
+    needles = (
+        "✅ Job Started",
+        "Deploy Application",
+        "12345",
+        "running",
+    )
+    missing = [needle for needle in needles if needle not in result]
+    assert not missing, f"missing: {missing}"
+    assert client.post_calls == [("/job/abc-123-def/run", VALID_RUN_BODY)]
+
+
+def test_run_job_reuses_cached_definition(mock_client):
+    """Test run_job fetches the job once across the preview and confirmed calls."""
+    mock_client.get.return_value = SAMPLE_JOB_DATA
+    mock_client.post.return_value = {
+        "id": 12345,
+        "href": "/api/44/execution/12345",
+        "permalink": "/project/myproject/execution/show/12345",
+        "status": "running",
+        "project": "myproject",
+        "user": "admin",
+        # Rundeck recalculates averageDuration after every run; it must not evict the definition
+        "job": {"id": "abc-123-def", "name": "Deploy Application", "averageDuration": 50000},
+    }
+
+    run_job("abc-123-def", VERSION_ONLY_REQUEST)
+    run_job("abc-123-def", VERSION_ONLY_REQUEST, confirmed=True)
+    run_job("abc-123-def", VERSION_ONLY_REQUEST)
+    assert mock_client.get.call_count == 1
+
+    clear_job_cache()
+    run_job("abc-123-def", VERSION_ONLY_REQUEST)
+    assert mock_client.get.call_count == 2
+
+    run_job("abc-123-def", VERSION_ONLY_REQUEST, refresh=True)
+    assert mock_client.get.call_count == 3
+
+
+def test_run_job_by_index(mock_client):
+    """Test run_job_by_index resolves the # from the last list_jobs table."""
+    mock_client.get.side_effect = [SAMPLE_JOBS_LIST, SAMPLE_JOB_DATA]
+
+    with pytest.raises(ValueError, match="Call list_jobs first"):
+        run_job_by_index(1, "myproject")
+
+    list_jobs(SECOND_PAGE_QUERY)
+    result = run_job_by_index(12, "myproject", VERSION_ONLY_REQUEST)
+
+    assert "Ready to run" in result
+    mock_client.get.assert_called_with("/job/def-456")
+    with pytest.raises(ValueError):
+        run_job_by_index(1, "myproject")
+
+
+def test_run_job_by_index_keeps_listings_apart(stub_client):
+    """Test interleaved listings of other projects and servers do not change which job a # runs."""
+    stub_client(get_ret=SAMPLE_JOBS_LIST)
+    list_jobs(MYPROJECT_QUERY)
+    stub_client(get_ret=[{"id": "xyz-789", "name": "Cleanup", "project": "ops"}])
+    list_jobs(JobQuery(project="ops"))
+    other_server = stub_client(get_ret=[{"id": "foreign-1", "name": "Foreign", "project": "myproject"}])
+    other_server.base_url = "http://other.local"
+    list_jobs(MYPROJECT_QUERY)
+
+    client = stub_client(get_ret=SAMPLE_JOB_DATA)
+    result = run_job_by_index(1, "myproject", VERSION_ONLY_REQUEST)
+
+    assert "Ready to run" in result
+    assert client.get_calls == [("/job/abc-123", None)]
+    # The definition fetched for row 1 of 'ops' belongs to another project, so nothing runs
+    with pytest.raises(ValueError, match="not in project 'ops'"):
+        run_job_by_index(1, "ops", job_id="xyz-789", confirmed=True)
+    assert client.post_calls == []
+
+
+def test_run_job_by_index_confirms_previewed_job(stub_client):
+    """Test the confirmed call refuses to run when a listing after the preview renumbered the table."""
+    run_response = {
+        "id": 12345,
+        "href": "/api/44/execution/12345",
+        "permalink": "/project/myproject/execution/show/12345",
+        "status": "running",
+        "project": "myproject",
+        "user": "admin",
+        "job": {"id": "abc-123", "name": "Job 1", "project": "myproject"},
+    }
+    stub_client(get_ret=SAMPLE_JOBS_LIST)
+    list_jobs(MYPROJECT_QUERY)
+    client = stub_client(get_ret={**SAMPLE_JOB_DATA, "id": "abc-123"})
+    preview = run_job_by_index(1, "myproject", VERSION_ONLY_REQUEST)
+    assert "**Job ID:** `abc-123`" in preview
+    assert 'job_id="abc-123"' in preview
+
+    with pytest.raises(ValueError, match="requires the job_id"):
+        run_job_by_index(1, "myproject", VERSION_ONLY_REQUEST, confirmed=True)
+
+    # Another listing between the preview and the confirmation puts a different job at #1
+    stub_client(get_ret=SAMPLE_JOBS_LIST[::-1])
+    list_jobs(MYPROJECT_QUERY)
+    client = stub_client(get_ret={**SAMPLE_JOB_DATA, "id": "def-456"}, post_ret=run_response)
+    with pytest.raises(ValueError, match="now refers to def-456, not the previewed job abc-123"):
+        run_job_by_index(1, "myproject", VERSION_ONLY_REQUEST, job_id="abc-123", confirmed=True)
+    assert client.post_calls == []
+
+    result = run_job_by_index(2, "myproject", VALID_REQUEST, job_id="abc-123", confirmed=True)
+    assert "✅ Job Started" in result
+    assert client.post_calls == [("/job/abc-123/run", VALID_RUN_BODY)]
+
+
+def test_run_jobs_preview(mock_client):
+    """Test run_jobs validates the batch and shows a preview without confirmed=True."""
+    mock_client.get_many = AsyncMock(return_value=[SAMPLE_JOB_DATA])
+    mock_client.post_many = AsyncMock()
+
+    runs = [
+        BatchJobRunRequest(job_id="abc-123-def", options={"version": "1.0"}),
+        BatchJobRunRequest(job_id="abc-123-def", options={"version": "2.0", "env": "prod"}),
+    ]
+    result = asyncio.run(run_jobs(runs))
+
+    assert "🚀 Ready to run 2 jobs" in result
+    assert "`version=2.0`, `env=prod`" in result
+    assert "confirmed=True" in result
+    assert mock_client.post_many.call_count == 0
+    # Both runs share one job, so its definition is fetched once, without a blocking get
+    mock_client.get_many.assert_awaited_once_with([("/job/abc-123-def", None)])
+    assert mock_client.get.call_count == 0
+
+
+def test_run_jobs_validates_options(mock_client):
+    """Test run_jobs refuses to execute when any job in the batch is invalid."""
+    mock_client.get_many = AsyncMock(return_value=[SAMPLE_JOB_DATA])
+    mock_client.post_many = AsyncMock()
+
+    runs = [
+        BatchJobRunRequest(job_id="abc-123-def", options={"version": "1.0"}),
+        BatchJobRunRequest(job_id="abc-123-def", options={"env": "prod"}),
+    ]
+    result = asyncio.run(run_jobs(runs, confirmed=True))
+
+    assert "❌ Cannot run" in result
+    assert "Required option 'version' is missing" in result
+    assert mock_client.post_many.call_count == 0
+
+
+def test_run_jobs_success(mock_client):
+    """Test run_jobs executes the batch and reports partial failures."""
+    mock_client.get_many = AsyncMock(return_value=[SAMPLE_JOB_DATA])
+    mock_client.post_many = AsyncMock(
+        return_value=[
+            {
+                "id": 12345,
+                "href": "/api/44/execution/12345",
+                "permalink": "/project/myproject/execution/show/12345",
+                "status": "running",
+                "project": "myproject",
+                "user": "admin",
+                "job": {"id": "abc-123-def", "name": "Deploy Application", "project": "myproject"},
+            },
+            httpx.ConnectError("Connection refused | retrying\nsecond line"),
+        ]
+    )
+
+    runs = [
+        BatchJobRunRequest(job_id="abc-123-def", options={"version": "1.0"}),
+        BatchJobRunRequest(job_id="abc-123-def", options={"version": "2.0"}),
+    ]
+    result = asyncio.run(run_jobs(runs, confirmed=True))
+
+    assert "Started 1 of 2 jobs" in result
+    assert "`12345`" in result
+    # The error is collapsed to one escaped line so the table stays intact
+    assert "| ❌ ConnectError: Connection refused \\| retrying |\n" in result
+    assert "second line" not in result
+    mock_client.post_many.assert_awaited_once_with(
+        [
+            ("/job/abc-123-def/run", {"options": {"version": "1.0"}}),
+            ("/job/abc-123-def/run", {"options": {"version": "2.0"}}),
+        ]
+    )